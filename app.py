@@ -1,19 +1,50 @@
 import streamlit as st
-from fpdf import FPDF
-from fpdf.enums import XPos, YPos
 import os
+import time
+from functools import lru_cache
 import pandas as pd
-from groq import Groq
 from dotenv import load_dotenv
+from llm import (
+    GROQ_TIMEOUT,
+    SYSTEM_PROMPT,
+    backend_settings,
+    choose_route,
+    get_llm_client,
+    llm_available,
+    describe_error,
+    complete_chat,
+    stream_chat,
+    prefetch_chat,
+    cancel_pending_request,
+)
+from context_window import build_messages, count_message_tokens, prefix_message
+from response_cache import get_response_cache, make_cache_key
+from pdf_report import build_report_pdf, report_digest, check_report_font
+from sections import SECTIONS, validate_section
+from pension import balance_paths, pension_summary, pension_sensitivity
+from tax import tax_summary
+from monte_carlo import PERCENTILES, investment_simulation, investment_summary
+from session_store import restore_session, persist_session
+from metrics import get_metrics
 
 
 
 # .env 파일 로드
 load_dotenv()
 
-# 환경 변수 읽기
-api_key = os.getenv("GROQ_API_KEY")
+# 보고서 폰트 확인 (서버 시작 시 한 번)
+font_problem = st.cache_resource(show_spinner=False)(check_report_font)()
 
+# 응답 스트리밍 여부 (GROQ_STREAM=0 이면 기존처럼 한 번에 받음)
+stream_enabled = os.getenv("GROQ_STREAM", "1") != "0"
+
+# 보고서 화면이 뜨면 초기 포트폴리오 검토를 미리 요청 (GROQ_PREFETCH=1 일 때만, API 호출이 늘어남)
+prefetch_enabled = os.getenv("GROQ_PREFETCH", "0") == "1"
+PREFETCH_QUESTION = "제 보고서를 바탕으로 현재 포트폴리오에 대한 초기 검토 의견을 주세요."
+
+# 상담 화면에 한 번에 보여주는 최근 메시지 수 ("이전 메시지 더 보기" 를 누를 때마다 이만큼 늘어남)
+CHAT_PAGE_MESSAGES = int(os.getenv("CHAT_PAGE_MESSAGES", "20"))
+CHAT_AVATARS = {"user": "👤", "assistant": "🤖"}
 
 # 초기 상태 설정
 if "page" not in st.session_state:
@@ -24,6 +55,15 @@ if "user_data" not in st.session_state:
     st.session_state["user_data"] = {}
 if "chat_history" not in st.session_state:
     st.session_state["chat_history"] = []
+if "llm_timings" not in st.session_state:
+    st.session_state["llm_timings"] = []
+if "chat_summary" not in st.session_state:
+    st.session_state["chat_summary"] = {}
+if "derived" not in st.session_state:
+    st.session_state["derived"] = {}
+
+# 저장소에서 세션 상태 복원 (재접속하거나 다른 서버 프로세스로 연결되어도 이어서 진행)
+restore_session(st.session_state)
 
 def utf8_text(pdf, x, y, text):
     pdf.set_xy(x, y)
@@ -34,7 +74,7 @@ def utf8_text(pdf, x, y, text):
 def checklist_page():
     st.title("📋 항목 선택")
     st.write("원하는 항목을 선택하세요:")
-    options = ["세금 관리", "투자 관리", "연금 관리", "보험 관리"]
+    options = SECTIONS
     selected = st.multiselect("항목 선택", options, default=st.session_state["selected_sections"])
     st.session_state["selected_sections"] = selected
     if st.button("다음 단계로"):
@@ -47,99 +87,319 @@ def checklist_page():
 def input_form_page():
     st.title("📝 입력 폼")
     st.write("선택한 항목에 대한 정보를 입력하세요:")
-    
-    for section in st.session_state["selected_sections"]:
-        st.subheader(section)
-        if section == "세금 관리":
-            income = st.number_input("연소득 (만원):", min_value=0, step=100)
-            tax_rate = st.slider("세율 (%)", 0, 50, 15)
-            st.session_state["user_data"]["세금 관리"] = {"연소득": income, "세율": tax_rate}
-        elif section == "투자 관리":
-            stock_name = st.text_input("종목 이름:")
-            shares = st.number_input("보유 주식 수:", min_value=0, step=1)
-            price_per_share = st.number_input("주당 가격 (만원):", min_value=0.0, step=0.1)
-            st.session_state["user_data"]["투자 관리"] = {
-                "종목 이름": stock_name,
-                "보유 주식 수": shares,
-                "주당 가격": price_per_share,
-            }
-        elif section == "연금 관리":
-            monthly_contribution = st.number_input("월 납입액 (만원):", min_value=0, step=1)
-            years = st.number_input("납입 기간 (년):", min_value=0, step=1)
-            interest_rate = st.slider("연 이자율 (%)", 0.0, 10.0, 3.0)
-            st.session_state["user_data"]["연금 관리"] = {
-                "월 납입액": monthly_contribution,
-                "납입 기간": years,
-                "연 이자율": interest_rate,
-            }
-        elif section == "보험 관리":
-            insurance_name = st.text_input("보험 이름:")
-            monthly_premium = st.number_input("월 보험료 (만원):", min_value=0, step=1)
-            coverage_amount = st.number_input("보장 금액 (만원):", min_value=0, step=100)
-            st.session_state["user_data"]["보험 관리"] = {
-                "보험 이름": insurance_name,
-                "월 보험료": monthly_premium,
-                "보장 금액": coverage_amount,
-            }
-    
-    if st.button("보고서 생성"):
-        if st.session_state["user_data"]:
-            st.session_state["page"] = "report"
-        else:
+    previous = st.session_state["user_data"]
+
+    # 입력할 때마다 전체 스크립트가 다시 실행되지 않도록 폼으로 묶어 제출할 때 한 번만 처리
+    with st.form("input_form"):
+        entered = {}
+        for section in st.session_state["selected_sections"]:
+            st.subheader(section)
+            old = previous.get(section, {})
+            if section == "세금 관리":
+                income = st.number_input("연소득 (만원):", min_value=0, step=100, value=old.get("연소득", 0))
+                dependents = st.number_input("부양가족 수 (본인 제외):", min_value=0, step=1, value=old.get("부양가족 수", 0))
+                entered["세금 관리"] = {"연소득": income, "부양가족 수": dependents}
+            elif section == "투자 관리":
+                stock_name = st.text_input("종목 이름:", value=old.get("종목 이름", ""))
+                shares = st.number_input("보유 주식 수:", min_value=0, step=1, value=old.get("보유 주식 수", 0))
+                price_per_share = st.number_input("주당 가격 (만원):", min_value=0.0, step=0.1, value=float(old.get("주당 가격", 0.0)))
+                entered["투자 관리"] = {
+                    "종목 이름": stock_name,
+                    "보유 주식 수": shares,
+                    "주당 가격": price_per_share,
+                }
+            elif section == "연금 관리":
+                monthly_contribution = st.number_input("월 납입액 (만원):", min_value=0, step=1, value=old.get("월 납입액", 0))
+                years = st.number_input("납입 기간 (년):", min_value=0, step=1, value=old.get("납입 기간", 0))
+                interest_rate = st.slider("연 이자율 (%)", 0.0, 10.0, float(old.get("연 이자율", 3.0)))
+                entered["연금 관리"] = {
+                    "월 납입액": monthly_contribution,
+                    "납입 기간": years,
+                    "연 이자율": interest_rate,
+                }
+            elif section == "보험 관리":
+                insurance_name = st.text_input("보험 이름:", value=old.get("보험 이름", ""))
+                monthly_premium = st.number_input("월 보험료 (만원):", min_value=0, step=1, value=old.get("월 보험료", 0))
+                coverage_amount = st.number_input("보장 금액 (만원):", min_value=0, step=100, value=old.get("보장 금액", 0))
+                entered["보험 관리"] = {
+                    "보험 이름": insurance_name,
+                    "월 보험료": monthly_premium,
+                    "보장 금액": coverage_amount,
+                }
+        submitted = st.form_submit_button("보고서 생성")
+
+    if submitted:
+        errors = [message for section, data in entered.items() for message in validate_section(section, data)]
+        if not entered:
             st.warning("모든 선택 항목에 대해 데이터를 입력해주세요.")
+        elif errors:
+            for message in errors:
+                st.warning(message)
+        else:
+            # 입력이 바뀐 항목만 계산을 다시 함
+            for section, data in entered.items():
+                get_derived(section, data)
+            st.session_state["user_data"] = entered
+            st.session_state["page"] = "report"
+
+# 항목별 계산 결과 (세금/시뮬레이션/적립금 예측)
+def compute_derived(section, data):
+    if section == "세금 관리":
+        return {"summary": tax_summary(data)}
+    if section == "투자 관리":
+        return {
+            "summary": investment_summary(data),
+            "simulation": investment_simulation(data["종목 이름"], data["보유 주식 수"], data["주당 가격"]),
+        }
+    if section == "연금 관리":
+        return {
+            "summary": pension_summary(data),
+            "yearly": balance_paths(data["월 납입액"], data["납입 기간"], data["연 이자율"])[::12],
+            "sensitivity": pension_sensitivity(data),
+        }
+    return {}
+
+# 입력이 그대로면 저장된 계산 결과를 재사용
+def get_derived(section, data):
+    derived = st.session_state["derived"]
+    if section not in derived or derived[section]["input"] != data:
+        derived[section] = {"input": dict(data), **compute_derived(section, data)}
+    return derived[section]
+
+# 연금 관리 항목의 적립금 예측 (만기 적립금, 연도별 적립금 추이, 민감도 표)
+def pension_report(derived):
+    for key, value in derived["summary"].items():
+        st.write(f"- **{key}**: {value:,} 만원")
+
+    yearly = derived["yearly"]
+    if yearly.size > 1:
+        st.line_chart(pd.DataFrame({"적립금 (만원)": yearly}, index=pd.Index(range(len(yearly)), name="연차")))
+
+    rates, years, grid = derived["sensitivity"]
+    st.caption("연 이자율 × 납입 기간별 예상 적립금 (만원)")
+    st.dataframe(pd.DataFrame(grid, index=[f"{rate:.1f}%" for rate in rates], columns=[f"{year}년" for year in years]))
+
+# 투자 관리 항목의 1년 몬테카를로 시뮬레이션 (분위수 밴드, VaR/CVaR)
+def investment_report(derived):
+    for key, value in derived["summary"].items():
+        st.write(f"- **{key}**: {value:,} 만원")
+
+    result = derived["simulation"]
+    bands = pd.DataFrame(
+        result["bands"],
+        index=pd.Index(result["steps"], name="거래일"),
+        columns=[f"{p}%" for p in PERCENTILES],
+    )
+    st.line_chart(bands)
+    if result["history"]:
+        st.caption("과거 가격 이력의 일별 수익률을 복원 추출한 시뮬레이션입니다.")
+    else:
+        st.caption("가격 이력 파일이 없어 기본 가정(연 수익률 7%, 변동성 25%)의 기하 브라운 운동으로 시뮬레이션했습니다.")
 
 # 3. 보고서 생성 페이지
 def report_page():
     st.title("📄 생성된 보고서")
     st.write("입력된 데이터를 기반으로 보고서를 생성했습니다.")
+    # 보고서를 그리는 동안에도 초기 검토 요청이 진행되도록 먼저 시작
+    start_prefetch()
     
     for section, data in st.session_state["user_data"].items():
         st.subheader(section)
         for key, value in data.items():
             st.write(f"- **{key}**: {value}")
+        if section == "세금 관리":
+            for key, value in get_derived(section, data)["summary"].items():
+                st.write(f"- **{key}**: {value:,} 만원" if isinstance(value, int) else f"- **{key}**: {value}")
+        elif section == "투자 관리":
+            investment_report(get_derived(section, data))
+        elif section == "연금 관리":
+            pension_report(get_derived(section, data))
     
     if st.button("GPT와 상담 시작"):
         st.session_state["page"] = "chat"
 
+# 초기 검토 응답의 캐시 키 (보고서 내용이 같으면 세션이 달라도 같은 키)
+def prefetch_cache_key(user_data):
+    return make_cache_key(SYSTEM_PROMPT, user_data, [], PREFETCH_QUESTION, backend_settings()["model"])
+
+# 보고서를 읽는 동안 초기 검토를 백그라운드에서 받아 응답 캐시에 넣어 둠
+def start_prefetch():
+    if not prefetch_enabled or not llm_available() or st.session_state["chat_history"]:
+        return
+    key = prefetch_cache_key(st.session_state["user_data"])
+    prefetch = st.session_state.get("prefetch")
+    if prefetch is not None and prefetch["key"] == key:
+        return
+    # 보고서 화면은 실행이 잦으므로 적중률 통계(상담 질문 기준)에 잡히지 않게 확인만 함
+    cache = get_response_cache()
+    if cache.contains(key):
+        return
+    if prefetch is not None:
+        prefetch["request"].cancel()
+
+    messages, _ = build_messages(
+        SYSTEM_PROMPT,
+        st.session_state["user_data"],
+        [{"role": "user", "content": PREFETCH_QUESTION}],
+        {},
+    )
+    try:
+        request = prefetch_chat(
+            get_llm_client(),
+            messages,
+            lambda text: cache.put(key, text),
+            model=backend_settings()["model"],
+            owner=st.session_state.get("session_id"),
+        )
+    except Exception:
+        return
+    st.session_state["prefetch"] = {"key": key, "request": request}
+    get_metrics().inc("app_prefetch_total", result="started")
+
+# 미리 받아 둔 초기 검토가 있으면 돌려줌 (아직 오는 중이면 끝날 때까지 기다림)
+def take_prefetched_review():
+    prefetch = st.session_state.pop("prefetch", None)
+    if prefetch is None:
+        return None
+    key = prefetch_cache_key(st.session_state["user_data"])
+    if prefetch["key"] != key:
+        prefetch["request"].cancel()
+        return None
+    with st.spinner("초기 포트폴리오 검토를 준비하는 중..."):
+        prefetch["request"].finished.wait(GROQ_TIMEOUT)
+    review = get_response_cache().get(key)
+    get_metrics().inc("app_prefetch_total", result="used" if review is not None else "failed")
+    return review
+
+# 메시지 본문을 마크다운으로 변환 (메시지별로 한 번만 계산)
+# $ 가 수식으로 해석되지 않도록 이스케이프하고 한 줄 바꿈도 그대로 보이게 함
+@lru_cache(maxsize=4096)
+def chat_markdown(content):
+    return content.replace("$", "\\$").replace("\n", "  \n")
+
+# "이전 메시지 더 보기" 콜백 (스크립트 실행 전에 호출되므로 같은 실행에서 바로 반영)
+def show_older_messages():
+    st.session_state["chat_visible"] = st.session_state.get("chat_visible", CHAT_PAGE_MESSAGES) + CHAT_PAGE_MESSAGES
+
+def render_chat_message(chat):
+    with st.chat_message(chat["role"], avatar=CHAT_AVATARS.get(chat["role"])):
+        st.markdown(chat_markdown(chat["content"]))
+
+# 질문 하나에 대한 답변 (캐시 또는 LLM), 화면에 출력하고 기록에 추가
+def answer_question(user_input):
+    metrics = get_metrics()
+    # 짧은 질문은 빠른 백엔드로 (LLM_FAST_* 설정 시), 모델이 다르면 캐시 키도 다름
+    route = choose_route(user_input)
+    settings = backend_settings(route)
+
+    # 같은 프로필/질문에 대한 응답이 캐시에 있으면 API 호출 없이 바로 사용
+    cache = get_response_cache()
+    cache_key = make_cache_key(
+        SYSTEM_PROMPT,
+        st.session_state["user_data"],
+        st.session_state["chat_history"][:-1],
+        user_input,
+        settings["model"],
+    )
+    start = time.perf_counter()
+    cached_response = cache.get(cache_key)
+    metrics.inc("app_response_cache_requests_total", result="miss" if cached_response is None else "hit")
+    metrics.set("app_response_cache_hit_ratio", round(cache.hit_rate(), 4))
+    if cached_response is not None:
+        render_chat_message({"role": "assistant", "content": cached_response})
+        elapsed = time.perf_counter() - start
+        st.session_state["chat_history"].append({"role": "assistant", "content": cached_response})
+        st.session_state["llm_timings"].append(
+            {"cache_hit": True, "first_token": elapsed, "total": elapsed, "prompt_tokens": 0, "completion_tokens": 0}
+        )
+        st.caption(f"캐시된 응답 · {elapsed * 1000:.1f}ms · API 토큰 0")
+    else:
+        # 최근 기록 + 이전 상담 요약 + 보고서 요약으로 토큰 예산 안의 메시지 구성
+        messages, prompt_tokens = build_messages(
+            SYSTEM_PROMPT,
+            st.session_state["user_data"],
+            st.session_state["chat_history"],
+            st.session_state["chat_summary"],
+        )
+        # 비교 기준: 같은 고정 앞부분(시스템 프롬프트 + 프로필) 뒤에 전체 기록을 그대로 보낸 경우
+        full_tokens = count_message_tokens(
+            [prefix_message(SYSTEM_PROMPT, st.session_state["user_data"]), *st.session_state["chat_history"]]
+        )
+        timing = {"prompt_tokens_est": prompt_tokens, "full_history_tokens_est": full_tokens}
+
+        with st.chat_message("assistant", avatar=CHAT_AVATARS["assistant"]):
+            try:
+                # 프로세스 공용 클라이언트 (연결 풀 재사용)
+                client = get_llm_client(route)
+                if stream_enabled:
+                    # 토큰이 도착하는 대로 화면에 출력
+                    gpt_response = st.write_stream(
+                        stream_chat(client, messages, timing, st.session_state, model=settings["model"], route=route)
+                    )
+                else:
+                    gpt_response = complete_chat(
+                        client, messages, timing, st.session_state, model=settings["model"], route=route
+                    )
+                    st.write(gpt_response)
+            except Exception as e:
+                metrics.inc("app_errors_total", stage="llm", error=type(e).__name__)
+                gpt_response = describe_error(e, settings["backend"])
+                st.write(gpt_response)
+
+        # 응답이 끝까지 도착한 뒤에만 기록에 추가 (오류 메시지는 캐시하지 않음)
+        st.session_state["chat_history"].append({"role": "assistant", "content": gpt_response})
+        if "total" in timing:
+            cache.put(cache_key, gpt_response)
+            st.session_state["llm_timings"].append(timing)
+            for stage in ("queue_wait", "first_token", "total"):
+                if stage in timing:
+                    metrics.observe("app_llm_seconds", timing[stage], stage=stage, backend=settings["backend"])
+            for kind in ("prompt", "completion"):
+                if f"{kind}_tokens" in timing:
+                    metrics.inc("app_llm_tokens_total", timing[f"{kind}_tokens"], kind=kind, backend=settings["backend"])
+            # 추정치끼리 비교하고, 서버가 알려준 실제 사용량(실제 토크나이저 기준)은 따로 표시
+            usage = f" · 실제 {timing['prompt_tokens']} 토큰" if "prompt_tokens" in timing else ""
+            st.caption(
+                f"첫 토큰 {timing.get('first_token', timing['total']) * 1000:.0f}ms · 전체 {timing['total']:.2f}s · "
+                f"프롬프트 약 {prompt_tokens} 토큰 (전체 기록 전송 시 약 {full_tokens}){usage}"
+            )
+
 # 4. GPT 상담 페이지
 def chat_page():
     st.title("💬 GPT 상담")
     st.write("생성된 보고서를 바탕으로 GPT와 상담하세요.")
-    
-    user_input = st.text_input("질문을 입력하세요:")
+
+    # 보고서 화면에서 미리 받아 둔 초기 검토를 첫 답변으로 표시
+    if not st.session_state["chat_history"]:
+        review = take_prefetched_review()
+        if review is not None:
+            st.session_state["chat_history"].append({"role": "assistant", "content": review})
+
+    # 최근 메시지만 표시해서 대화가 길어져도 실행마다 그리는 양이 일정하도록 함
+    history = st.session_state["chat_history"]
+    hidden = max(len(history) - st.session_state.get("chat_visible", CHAT_PAGE_MESSAGES), 0)
+    if hidden:
+        st.button(f"이전 메시지 더 보기 ({hidden}개)", on_click=show_older_messages)
+    for chat in history[hidden:]:
+        render_chat_message(chat)
+
+    # chat_input 은 제출한 실행에서만 값을 돌려주므로 다른 버튼을 눌러도 질문이 다시 전송되지 않음
+    user_input = st.chat_input("질문을 입력하세요:")
     if user_input:
         # 사용자 입력 저장
         st.session_state["chat_history"].append({"role": "user", "content": user_input})
-        
-        # Groq API를 사용하여 GPT 응답 생성
-        from groq import Groq
-        import os
-
-        client = Groq(api_key=api_key)
+        render_chat_message(st.session_state["chat_history"][-1])
 
+        # 답변이 기록되기 전에 실행이 중단되면 (답변 도중 새 질문/버튼으로 다시 실행, 연결 종료)
+        # 답이 없는 질문이 기록에 남아 다음 요청/복원된 세션에 사용자 질문이 연달아 들어가므로 기록에서 뺌
         try:
-            # Groq API 호출
-            chat_completion = client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "너는 사람들에게 유능한 Wrap Account를 해주는 펀드 매니저야, 너의 고객은 한국 사람밖에 없으니 한국말로만 대답을 해야해 그렇지 않으면 너의 직업은 위태로워"},
-                    *st.session_state["chat_history"]  # 이전 채팅 기록 포함
-                ],
-                model="llama-3.3-70b-versatile"  # 사용할 모델
-            )
-            gpt_response = chat_completion.choices[0].message.content
-        except Exception as e:
-            gpt_response = f"Groq API 호출 중 오류가 발생했습니다: {e}"
-        
-        # GPT 응답 저장
-        st.session_state["chat_history"].append({"role": "assistant", "content": gpt_response})
-    
-    # 채팅 기록 표시
-    for chat in st.session_state["chat_history"]:
-        if chat["role"] == "user":
-            st.write(f"👤 사용자: {chat['content']}")
-        else:
-            st.write(f"🤖 GPT: {chat['content']}")
-    
+            answer_question(user_input)
+        except BaseException:
+            history = st.session_state["chat_history"]
+            if history and history[-1]["role"] == "user":
+                history.pop()
+            raise
+
     if st.button("최종 보고서 다운로드"):
         st.session_state["page"] = "download"
 
@@ -150,63 +410,52 @@ def chat_page():
 def download_page():
     st.title("📥 최종 보고서 다운로드")
     st.write("최종 보고서를 PDF로 다운로드하세요.")
+    if font_problem:
+        st.warning(font_problem)
 
-    # PDF 생성
-    pdf = FPDF()
-    pdf.add_page()
-
-    # 유니코드 폰트 추가 (절대 경로 설정)
-    font_path = os.path.abspath('./font/NotoSansCJKkr-Medium.otf')  # 절대 경로 사용
-    pdf.add_font('NotoSans', '', font_path, uni=True)
-    pdf.set_font('NotoSans', size=12)
-
-    # 제목 추가
-    pdf.cell(200, 10, txt="최종 보고서", ln=True, align="C")
-    pdf.ln(10)
-
-    # 사용자 데이터 추가
-    if "user_data" in st.session_state:
-        for section, data in st.session_state["user_data"].items():
-            pdf.cell(200, 10, txt=section, ln=True, align="L")
-            for key, value in data.items():
-                pdf.cell(200, 10, txt=f"{key}: {value}", ln=True, align="L")
-            pdf.ln(5)
-
-    # GPT 상담 내용 추가
-    if "chat_history" in st.session_state:
-        pdf.ln(10)
-        pdf.cell(200, 10, txt="GPT 상담 내용", ln=True, align="L")
-        for chat in st.session_state["chat_history"]:
-            if chat["role"] == "user":
-                pdf.cell(200, 10, txt=f"사용자: {chat['content']}", ln=True, align="L")
-            else:
-                pdf.cell(200, 10, txt=f"GPT: {chat['content']}", ln=True, align="L")
-
-    # PDF 저장
-    pdf_output = "final_report.pdf"
-    pdf.output(pdf_output)
+    # 세션별로 메모리에서 PDF 생성, 내용이 바뀌지 않았으면 이전에 만든 bytes 재사용
+    # (유휴 세션이면 session_store 가 이 dict 를 비워 메모리에서 내림)
+    digest = report_digest(st.session_state["user_data"], st.session_state["chat_history"])
+    cached_pdf = st.session_state.setdefault("report_pdf", {})
+    if cached_pdf.get("digest") != digest:
+        with get_metrics().timer("app_pdf_build_seconds"):
+            pdf_bytes = build_report_pdf(st.session_state["user_data"], st.session_state["chat_history"])
+        cached_pdf.update(digest=digest, data=pdf_bytes)
 
     # PDF 다운로드 버튼 생성
-    with open(pdf_output, "rb") as f:
-        st.download_button(
-            label="📄 PDF 다운로드",
-            data=f,
-            file_name="final_report.pdf",
-            mime="application/pdf"
-        )
+    st.download_button(
+        label="📄 PDF 다운로드",
+        data=cached_pdf["data"],
+        file_name="final_report.pdf",
+        mime="application/pdf"
+    )
 
 # 메인 함수
 def main():
-    if st.session_state["page"] == "checklist":
-        checklist_page()
-    elif st.session_state["page"] == "input_form":
-        input_form_page()
-    elif st.session_state["page"] == "report":
-        report_page()
-    elif st.session_state["page"] == "chat":
-        chat_page()
-    elif st.session_state["page"] == "download":
-        download_page()
+    # 이전 실행에서 남은 LLM 요청은 결과를 쓸 곳이 없으므로 취소
+    cancel_pending_request(st.session_state)
+    metrics = get_metrics()
+    page = st.session_state["page"]
+    try:
+        # 페이지별 실행 시간 (오류로 끝난 실행도 포함)
+        with metrics.timer("app_page_seconds", page=page):
+            if page == "checklist":
+                checklist_page()
+            elif page == "input_form":
+                input_form_page()
+            elif page == "report":
+                report_page()
+            elif page == "chat":
+                chat_page()
+            elif page == "download":
+                download_page()
+    except Exception as e:
+        metrics.inc("app_errors_total", stage=page, error=type(e).__name__)
+        raise
+    finally:
+        # 이번 실행에서 바뀐 상태만 저장소에 반영
+        persist_session(st.session_state)
+        metrics.maybe_flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+from pdf_report import build_report_pdf, warm_report_font
+from sections import SECTION_FIELDS, normalize_user_data, sections_from_flat
+
+
+# CSV ("client_id", "세금 관리.연소득" ... 열) 또는 JSONL 에서 고객 프로필 읽기
+def load_profiles(path):
+    profiles = []
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        for i, row in enumerate(rows, 1):
+            raw = row.get("user_data") or {k: v for k, v in row.items() if k in SECTION_FIELDS}
+            profiles.append((str(row.get("client_id", i)), raw, row.get("chat_history", [])))
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            for i, row in enumerate(csv.DictReader(f), 1):
+                profiles.append((str(row.get("client_id") or i), sections_from_flat(row), []))
+
+    clients = []
+    for client_id, raw, chat_history in profiles:
+        try:
+            clients.append({"client_id": client_id, "user_data": normalize_user_data(raw), "chat_history": chat_history})
+        except ValueError as e:
+            print(f"[건너뜀] {client_id}: {e}")
+    return clients
+
+
+# LLM 상담 한 번 (응답 캐시를 먼저 확인)
+def consult(client, question):
+    # 상담 단계를 쓸 때만 groq/streamlit 을 불러옴
+    from context_window import build_messages
+    from llm import PRIORITY_BACKGROUND, SYSTEM_PROMPT, backend_settings, complete_chat, get_llm_client
+    from response_cache import get_response_cache, make_cache_key
+
+    cache = get_response_cache()
+    model = backend_settings()["model"]
+    cache_key = make_cache_key(SYSTEM_PROMPT, client["user_data"], client["chat_history"], question, model)
+    answer = cache.get(cache_key)
+    if answer is None:
+        chat_history = [*client["chat_history"], {"role": "user", "content": question}]
+        messages, _ = build_messages(SYSTEM_PROMPT, client["user_data"], chat_history, {})
+        answer = complete_chat(get_llm_client(), messages, {}, model=model, priority=PRIORITY_BACKGROUND)
+        cache.put(cache_key, answer)
+    client["chat_history"] = [
+        *client["chat_history"],
+        {"role": "user", "content": question},
+        {"role": "assistant", "content": answer},
+    ]
+
+
+def _safe_name(client_id):
+    return re.sub(r"[^\w.-]", "_", client_id) or "client"
+
+
+# 프로세스 풀 워커: PDF 를 만들어 파일로 저장하고 걸린 시간을 돌려줌
+def render_client(client, out_dir):
+    start = time.perf_counter()
+    pdf_bytes = build_report_pdf(client["user_data"], client["chat_history"])
+    path = os.path.join(out_dir, f"{_safe_name(client['client_id'])}.pdf")
+    with open(path, "wb") as f:
+        f.write(pdf_bytes)
+    return client["client_id"], time.perf_counter() - start, len(pdf_bytes)
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def run_batch(path, out_dir, workers, question=None, llm_concurrency=4):
+    stages = {}
+    os.makedirs(out_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    clients = load_profiles(path)
+    stages["load"] = time.perf_counter() - start
+
+    errors = {"consult": 0, "render": 0}
+    if question:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=llm_concurrency) as pool:
+            futures = {pool.submit(consult, client, question): client for client in clients}
+            for future, client in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors["consult"] += 1
+                    print(f"[상담 실패] {client['client_id']}: {e}")
+        stages["consult"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_times = []
+    total_bytes = 0
+    # 워커마다 폰트를 먼저 준비해 두고 PDF 생성 시간만 측정
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_report_font) as pool:
+        futures = [pool.submit(render_client, client, out_dir) for client in clients]
+        for future in futures:
+            try:
+                _, seconds, size = future.result()
+                render_times.append(seconds)
+                total_bytes += size
+            except Exception as e:
+                errors["render"] += 1
+                print(f"[PDF 실패] {e}")
+    stages["render"] = time.perf_counter() - start
+
+    total = sum(stages.values())
+    print(f"\n보고서 {len(render_times)}건 생성 (상담 실패 {errors['consult']}건, PDF 실패 {errors['render']}건), "
+          f"출력 {total_bytes / 1024:.0f}KB → {out_dir}")
+    for stage, seconds in stages.items():
+        print(f"  {stage:<8} {seconds:8.2f}s")
+    if render_times:
+        print(f"  PDF 1건  p50 {_percentile(render_times, 0.5) * 1000:.0f}ms · "
+              f"p95 {_percentile(render_times, 0.95) * 1000:.0f}ms (워커 {workers}개)")
+    print(f"  처리량   {len(render_times) / total if total else 0:.1f} reports/sec")
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고객 프로필 CSV/JSONL 로 최종 보고서 PDF 를 한 번에 생성")
+    parser.add_argument("profiles", help="고객 프로필 파일 (.csv 는 '세금 관리.연소득' 형식의 열, .jsonl 은 줄마다 user_data)")
+    parser.add_argument("--out", default="reports", help="PDF 저장 디렉터리")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="PDF 생성 프로세스 수")
+    parser.add_argument("--consult", metavar="질문", help="고객마다 LLM 상담을 한 번 실행해 보고서에 포함")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="동시에 보낼 LLM 요청 수")
+    args = parser.parse_args()
+
+    load_dotenv()
+    run_batch(args.profiles, args.out, args.workers, args.consult, args.llm_concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import Metrics  # noqa: E402
+
+N = int(os.getenv("BENCH_METRICS_N", "200000"))
+
+
+def main():
+    metrics = Metrics()
+
+    # 기록 한 번의 비용 (페이지 실행 한 번에 많아야 10회 정도 호출)
+    start = time.perf_counter()
+    for i in range(N):
+        metrics.observe("app_page_seconds", (i % 1000) / 1000, page="chat")
+    observe = (time.perf_counter() - start) / N
+
+    start = time.perf_counter()
+    for _ in range(N):
+        metrics.inc("app_llm_tokens_total", 10, kind="prompt")
+    inc = (time.perf_counter() - start) / N
+
+    start = time.perf_counter()
+    for _ in range(N):
+        with metrics.timer("app_pdf_build_seconds"):
+            pass
+    timer = (time.perf_counter() - start) / N
+
+    # 파일 기록 (METRICS_FLUSH_SECONDS 마다 한 번)
+    for page in ("checklist", "input_form", "report", "chat", "download"):
+        metrics.observe("app_page_seconds", 0.1, page=page)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        for _ in range(100):
+            metrics.flush(os.path.join(directory, "metrics.prom"))
+        flush = (time.perf_counter() - start) / 100
+
+    print(f"observe: {observe * 1e6:.2f}us/회")
+    print(f"inc: {inc * 1e6:.2f}us/회")
+    print(f"timer: {timer * 1e6:.2f}us/회")
+    print(f"flush (Prometheus 텍스트): {flush * 1000:.2f}ms/회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import context_window  # noqa: E402
+from context_window import KEEP_TURNS, TOKEN_BUDGET, build_messages, count_message_tokens, count_tokens  # noqa: E402
+from llm import SYSTEM_PROMPT  # noqa: E402
+
+SESSIONS = int(os.getenv("BENCH_PROMPT_SESSIONS", "50"))
+TURNS = int(os.getenv("BENCH_PROMPT_TURNS", "12"))
+
+QUESTIONS = [
+    "제 연금 적립 계획이 은퇴 후 생활비로 충분할까요?",
+    "세금을 줄이려면 어떤 공제를 더 활용할 수 있나요?",
+    "지금 보유한 종목 비중을 줄이고 채권을 늘려야 할까요?",
+    "보험 보장 금액이 가족 구성에 비해 적절한가요?",
+    "매달 추가로 저축할 수 있는 금액이 있다면 어디에 넣는 게 좋을까요?",
+]
+ANSWER = (
+    "고객님의 현재 상황을 보면 연금 납입액은 안정적이지만 투자 비중이 한 종목에 집중되어 있습니다. "
+    "분산 투자를 위해 ETF 와 채권 비중을 늘리고, 연말정산에서 연금저축 세액공제를 최대한 활용하시길 권합니다. "
+)
+
+
+# 변경 전 방식: 입력 순서 그대로 직렬화하고 요약을 시스템 메시지 끝에 붙임
+def _old_format(user_data):
+    return "\n".join(
+        f"{section}: " + ", ".join(f"{key}={value}" for key, value in data.items())
+        for section, data in user_data.items()
+    )
+
+
+def _old_messages(system_prompt, user_data, chat_history, summary_state):
+    def system():
+        content = system_prompt + "\n\n[고객 보고서]\n" + _old_format(user_data)
+        if summary_state.get("lines"):
+            content += "\n\n[이전 상담 요약]\n" + "\n".join(summary_state["lines"])
+        return {"role": "system", "content": content}
+
+    split = max(len(chat_history) - 1 - KEEP_TURNS * 2, summary_state.get("folded", 0), 0)
+    split = min(split, max(len(chat_history) - 1, 0))
+    context_window._fold(chat_history, summary_state, split)
+    messages = [system(), *chat_history[split:]]
+    while count_message_tokens(messages) > TOKEN_BUDGET and split < len(chat_history) - 1:
+        split += 1
+        context_window._fold(chat_history, summary_state, split)
+        messages = [system(), *chat_history[split:]]
+    return messages
+
+
+# 같은 고객이라도 폼에서 항목을 고른 순서가 세션마다 다를 수 있음
+def _profile(rng):
+    sections = {
+        "세금 관리": {"연소득": rng.randrange(3000, 12000, 100), "부양가족 수": rng.randrange(0, 4)},
+        "투자 관리": {"종목 이름": "삼성전자", "보유 주식 수": rng.randrange(10, 300), "주당 가격": 7.0},
+        "연금 관리": {"월 납입액": 30, "납입 기간": 20, "연 이자율": 3.0},
+        "보험 관리": {"보험 이름": "종신보험", "월 보험료": 15, "보장 금액": 10000},
+    }
+    order = list(sections)
+    rng.shuffle(order)
+    return {section: sections[section] for section in order}
+
+
+def _serialize(messages):
+    return "".join(f"{m['role']}\n{m['content']}\n" for m in messages)
+
+
+def _common_prefix_tokens(a, b):
+    size = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        size += 1
+    return count_tokens(a[:size])
+
+
+def run(build):
+    rng = random.Random(0)
+    prompt_tokens = reused = requests = 0
+    for _ in range(SESSIONS):
+        user_data = _profile(rng)
+        chat_history, summary_state, previous = [], {}, ""
+        for turn in range(TURNS):
+            chat_history.append({"role": "user", "content": QUESTIONS[turn % len(QUESTIONS)]})
+            messages = build(SYSTEM_PROMPT, user_data, chat_history, summary_state)
+            serialized = _serialize(messages)
+            prompt_tokens += count_message_tokens(messages)
+            # 직전 요청과 같은 앞부분 = 제공자 측 프롬프트 캐시로 재사용할 수 있는 토큰
+            reused += _common_prefix_tokens(serialized, previous)
+            previous = serialized
+            requests += 1
+            chat_history.append({"role": "assistant", "content": ANSWER * 3})
+    return prompt_tokens / requests, reused / requests
+
+
+# 항목 순서만 다른 같은 프로필 두 개의 첫 메시지가 같은지 (응답 캐시/프롬프트 캐시 공유 여부)
+def cross_session_match(build):
+    data = _profile(random.Random(1))
+    reordered = {section: data[section] for section in reversed(list(data))}
+    question = [{"role": "user", "content": QUESTIONS[0]}]
+    return build(SYSTEM_PROMPT, data, list(question), {})[0] == build(SYSTEM_PROMPT, reordered, list(question), {})[0]
+
+
+def main():
+    def new(system_prompt, user_data, chat_history, summary_state):
+        return build_messages(system_prompt, user_data, chat_history, summary_state)[0]
+
+    print(f"세션 {SESSIONS}개 × {TURNS}턴 (KEEP_TURNS={KEEP_TURNS}, TOKEN_BUDGET={TOKEN_BUDGET})")
+    for name, build in (("변경 전", _old_messages), ("변경 후", new)):
+        tokens, reused = run(build)
+        print(f"{name}: 요청당 프롬프트 {tokens:.0f} 토큰, 직전 요청과 같은 앞부분 {reused:.0f} 토큰 "
+              f"({reused / tokens:.0%}), 항목 순서만 다른 프로필의 앞부분 일치: {cross_session_match(build)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import FakeGroqServer  # noqa: E402
+
+
+# 한 프로세스에서 세션 여러 개가 동시에 질문 (일부 질문은 세션끼리 겹침)
+def run(args):
+    server = FakeGroqServer(args.first_token_delay, 0.0, 20, rpm=args.quota_rpm, window=args.window).start()
+    os.environ.update({
+        "LLM_BACKEND": "groq",
+        "GROQ_API_KEY": "bench",
+        "GROQ_BASE_URL": server.url,
+        "GROQ_MAX_RETRIES": str(args.retries),
+    })
+    import llm
+
+    client = llm.get_llm_client()
+    results = []
+    lock = threading.Lock()
+
+    def session(index):
+        for turn in range(args.questions):
+            question = f"질문 {(index * args.questions + turn) % args.distinct}"
+            messages = [{"role": "system", "content": llm.SYSTEM_PROMPT}, {"role": "user", "content": question}]
+            start = time.perf_counter()
+            try:
+                llm.complete_chat(client, messages, {}, session={"session_id": str(index)})
+                ok = True
+            except Exception:
+                ok = False
+            with lock:
+                results.append((ok, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(args.sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.stop()
+
+    latencies = np.array([seconds for ok, seconds in results if ok])
+    return {
+        "answered": int(sum(ok for ok, _ in results)),
+        "failed": int(sum(not ok for ok, _ in results)),
+        "upstream_requests": server.requests,
+        "upstream_429": server.rejected,
+        "elapsed": elapsed,
+        "answered_per_sec": sum(ok for ok, _ in results) / elapsed,
+        "p50": float(np.percentile(latencies, 50)) if latencies.size else None,
+        "p95": float(np.percentile(latencies, 95)) if latencies.size else None,
+    }
+
+
+# main 경로(가짜 Groq)는 분당 1건으로 막혀 있고 fast 경로(stub)는 제한 없음
+# 한도에 걸린 main 요청이 대기열에 있어도 fast 요청은 바로 처리되어야 함
+def run_routes(args):
+    server = FakeGroqServer(args.first_token_delay, 0.0, 20).start()
+    os.environ.update({
+        "LLM_BACKEND": "groq",
+        "GROQ_API_KEY": "bench",
+        "GROQ_BASE_URL": server.url,
+        "LLM_FAST_BACKEND": "stub",
+        "LLM_RATE_RPM": "1",
+        "LLM_RATE_TPM": "0",
+        "GROQ_TIMEOUT": str(args.route_timeout),
+    })
+    import llm
+
+    def ask(route, question):
+        messages = [{"role": "system", "content": llm.SYSTEM_PROMPT}, {"role": "user", "content": question}]
+        llm.complete_chat(llm.get_llm_client(route), messages, {}, route=route)
+
+    # 첫 main 요청이 한도를 모두 쓰고, 두 번째 main 요청은 대기열에서 한도를 기다림
+    ask("main", "main 질문 1")
+    throttled = {}
+
+    def ask_throttled():
+        start = time.perf_counter()
+        try:
+            ask("main", "main 질문 2")
+            throttled["result"] = "답변"
+        except Exception as e:
+            throttled["result"] = type(e).__name__
+        throttled["seconds"] = time.perf_counter() - start
+
+    thread = threading.Thread(target=ask_throttled)
+    thread.start()
+    time.sleep(0.2)
+    start = time.perf_counter()
+    ask("fast", "짧은 질문")
+    fast_seconds = time.perf_counter() - start
+    thread.join()
+    server.stop()
+    return {"fast": fast_seconds, "main_throttled": throttled["seconds"], "main_result": throttled["result"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 한도/합치기 효과 측정 (한도가 있는 가짜 Groq 서버 사용)")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--questions", type=int, default=5, help="세션당 질문 수")
+    parser.add_argument("--distinct", type=int, default=50, help="서로 다른 질문 수 (작을수록 겹치는 질문이 많음)")
+    parser.add_argument("--quota-rpm", type=float, default=120, help="가짜 서버의 분당 요청 한도")
+    parser.add_argument("--window", type=float, default=5, help="가짜 서버가 한도를 세는 구간 (초)")
+    parser.add_argument("--first-token-delay", type=float, default=0.2)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--route-timeout", type=float, default=5, help="경로 분리 확인에서 한도에 걸린 main 요청의 제한 시간 (초)")
+    parser.add_argument("--route-max", type=float, default=1.0, help="경로 분리 확인에서 fast 요청이 넘으면 안 되는 시간 (초)")
+    parser.add_argument("--mode", choices=["off", "on", "routes"], help="(내부용) 한 가지 설정만 실행")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_routes(args) if args.mode == "routes" else run(args)))
+        return
+
+    # 설정은 import 시점에 읽으므로 설정마다 새 프로세스에서 실행
+    modes = {
+        "off": {"LLM_RATE_RPM": "0", "LLM_RATE_TPM": "0", "LLM_COALESCE": "0"},
+        "on": {
+            "LLM_RATE_RPM": str(args.quota_rpm),
+            "LLM_RATE_TPM": "0",
+            "LLM_RATE_BURST_SECONDS": str(args.window),
+            "LLM_COALESCE": "1",
+        },
+    }
+    print(f"세션 {args.sessions}개 × 질문 {args.questions}개, 서로 다른 질문 {args.distinct}개, "
+          f"서버 한도 {args.quota_rpm:.0f}/분 ({args.window:.0f}초 구간)")
+    for mode, env in modes.items():
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--mode", mode],
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        label = "한도/합치기 없음" if mode == "off" else "한도/합치기 사용"
+        print(f"{label}: 답변 {result['answered']}건, 실패 {result['failed']}건, "
+              f"서버 요청 {result['upstream_requests']}건, 429 {result['upstream_429']}건, "
+              f"{result['elapsed']:.1f}s ({result['answered_per_sec']:.2f}건/s), "
+              f"p50 {result['p50'] or 0:.2f}s, p95 {result['p95'] or 0:.2f}s")
+
+    output = subprocess.run(
+        [sys.executable, __file__, *sys.argv[1:], "--mode", "routes"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    ok = result["fast"] <= args.route_max
+    print(f"경로 분리: main 한도 초과 대기 중 fast 응답 {result['fast']:.2f}s "
+          f"(기준 {args.route_max:.1f}s, main 은 {result['main_throttled']:.1f}s 뒤 {result['main_result']}) "
+          f"{'OK' if ok else '실패'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATH = os.path.join(ROOT, "fintech-research.py")
+HISTORY_PATH = os.path.join(ROOT, ".cache", "startup_history.jsonl")
+
+METRICS = {
+    "script_import": "스크립트 최상단 import",
+    "first_paint": "첫 요소 전송",
+    "first_chart": "첫 그림 전송",
+    "first_run": "첫 실행 전체",
+    "next_section": "다른 섹션 (첫 실행 후 대기 뒤)",
+}
+
+
+# 스크립트 최상단의 import 문만 새 프로세스에서 실행한 시간
+def measure_imports(script):
+    tree = ast.parse(open(script, encoding="utf-8").read())
+    imports = ast.Module(body=[node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))], type_ignores=[])
+    code = compile(imports, script, "exec")
+    sys.path.insert(0, os.path.dirname(script))
+    import streamlit  # noqa: F401  (프레임워크 import 는 빼고 잼)
+
+    start = time.perf_counter()
+    exec(code, {"__name__": "__bench__"})
+    return {"script_import": time.perf_counter() - start}
+
+
+# 새 프로세스에서 첫 실행: 첫 요소/첫 그림이 전송되기까지 걸린 시간과 실행 전체 시간
+def measure_run(script, idle):
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, ROOT)
+    from research_common import SECTIONS
+
+    sent = {}
+    enqueue = ScriptRunContext.enqueue
+
+    def timed_enqueue(self, msg):
+        now = time.perf_counter()
+        if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            sent.setdefault("element", now)
+            if msg.delta.new_element.WhichOneof("type") == "plotly_chart":
+                sent.setdefault("chart", now)
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = timed_enqueue
+    at = AppTest.from_file(script, default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    result = {
+        "first_run": time.perf_counter() - start,
+        "first_paint": sent["element"] - start,
+        "first_chart": sent["chart"] - start,
+    }
+
+    # 첫 화면을 본 사용자가 잠시 읽은 뒤 다른 섹션으로 이동
+    time.sleep(idle)
+    seconds = []
+    for path, _, _ in SECTIONS[1:]:
+        at.switch_page(path)
+        start = time.perf_counter()
+        at.run()
+        seconds.append(time.perf_counter() - start)
+    result["next_section"] = float(np.mean(seconds))
+    return result
+
+
+def _child(args, mode, env):
+    output = subprocess.run(
+        [sys.executable, __file__, "--script", os.path.abspath(args.script), "--idle", str(args.idle), "--mode", mode],
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fintech-research.py 콜드 스타트 측정 (실행마다 새 프로세스)")
+    parser.add_argument("--script", default=SCRIPT_PATH)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--idle", type=float, default=3.0, help="첫 실행 뒤 다른 섹션으로 넘어가기 전 대기 시간 (초)")
+    parser.add_argument("--warmup", choices=["0", "1"], help="RESEARCH_WARMUP 값 (지정하지 않으면 환경 변수 그대로)")
+    parser.add_argument("--history", default=HISTORY_PATH, help="결과를 한 줄씩 누적할 JSONL 파일 (빈 문자열이면 기록 안 함)")
+    parser.add_argument("--mode", choices=["imports", "run"], help="(내부용) 측정 한 가지만 실행")
+    args = parser.parse_args()
+
+    if args.mode == "imports":
+        print(json.dumps(measure_imports(args.script)))
+        return
+    if args.mode == "run":
+        print(json.dumps(measure_run(args.script, args.idle)))
+        return
+
+    env = {"RESEARCH_WARMUP": args.warmup} if args.warmup else {}
+    samples = {name: [] for name in METRICS}
+    for _ in range(args.runs):
+        for mode in ("imports", "run"):
+            for name, value in _child(args, mode, env).items():
+                samples[name].append(value)
+    result = {name: float(np.median(values)) for name, values in samples.items()}
+
+    previous = None
+    if args.history and os.path.exists(args.history):
+        with open(args.history, encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        previous = json.loads(lines[-1])["result"] if lines else None
+
+    print(f"{os.path.basename(args.script)} 콜드 스타트 (새 프로세스 {args.runs}회 중앙값)")
+    for name, label in METRICS.items():
+        line = f"  {label}: {result[name] * 1000:.0f}ms"
+        if previous and name in previous:
+            line += f" (직전 기록 {previous[name] * 1000:.0f}ms)"
+        print(line)
+
+    if args.history:
+        if os.path.dirname(args.history):
+            os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as f:
+            record = {"timestamp": time.time(), "commit": _git_commit(), "warmup": args.warmup, "result": result}
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tax import income_tax, tax_summary  # noqa: E402
+
+N = int(os.getenv("BENCH_TAX_N", "1000000"))
+LOOP_N = 100_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    incomes = rng.lognormal(mean=np.log(4500), sigma=0.8, size=N).round()
+    dependents = rng.integers(0, 4, size=N)
+
+    # 벡터 계산: 1회 워밍업 후 5회 평균
+    income_tax(incomes[:1000], dependents[:1000])
+    start = time.perf_counter()
+    for _ in range(5):
+        result = income_tax(incomes, dependents)
+    vectorized = (time.perf_counter() - start) / 5
+
+    # 비교용: 고객 한 명씩 tax_summary 호출
+    start = time.perf_counter()
+    for income, count in zip(incomes[:LOOP_N].tolist(), dependents[:LOOP_N].tolist()):
+        tax_summary({"연소득": income, "부양가족 수": count})
+    per_client = (time.perf_counter() - start) / LOOP_N
+
+    print(f"소득 {N:,}건 벡터 계산: {vectorized * 1000:.1f}ms ({N / vectorized / 1e6:.1f}M건/s)")
+    print(f"고객별 반복 계산 (추정): {per_client * N:.1f}s ({per_client * 1e6:.1f}us/건)")
+    print(f"총 세액 합계: {result['총 세액'].sum():,.0f} 만원")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+
+PAGES = ["checklist", "input_form", "report", "chat", "download"]
+QUESTIONS = [
+    "제 연금 적립 계획이 적절한가요?",
+    "세금을 줄일 수 있는 방법이 있을까요?",
+    "투자 비중을 어떻게 조정하면 좋을까요?",
+    "보험 보장 금액이 충분한지 알려주세요.",
+    "은퇴 준비를 위해 무엇을 더 해야 하나요?",
+]
+
+
+# Groq OpenAI 호환 API 를 흉내 내는 로컬 서버 (첫 토큰 지연, 토큰 간 지연, 스트리밍 지원)
+# rpm 을 주면 최근 window 초 동안의 요청 수가 rpm × window / 60 을 넘을 때 429 와 retry-after 를 돌려줌
+class FakeGroqServer:
+    def __init__(self, first_token_delay, token_delay, tokens, rpm=0, window=60):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.tokens = tokens
+        self.rpm = rpm
+        self.window = window
+        self.requests = 0
+        self.rejected = 0
+        self._recent = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="fake-groq").start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_chunk(self, data):
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with fake._lock:
+                    now = time.monotonic()
+                    fake._recent = [t for t in fake._recent if now - t < fake.window]
+                    limited = fake.rpm and len(fake._recent) >= max(fake.rpm * fake.window / 60, 1)
+                    if limited:
+                        fake.rejected += 1
+                        retry_after = fake.window - (now - fake._recent[0])
+                    else:
+                        fake.requests += 1
+                        fake._recent.append(now)
+                if limited:
+                    data = json.dumps({"error": {"message": "Rate limit reached", "type": "tokens", "code": "rate_limit_exceeded"}}).encode()
+                    self.send_response(429)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.send_header("retry-after", f"{retry_after:.2f}")
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                model = body.get("model", "fake")
+                words = [f"응답{i} " for i in range(fake.tokens)]
+                prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 2
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": fake.tokens,
+                    "total_tokens": prompt_tokens + fake.tokens,
+                }
+                time.sleep(fake.first_token_delay)
+
+                if not body.get("stream"):
+                    time.sleep(fake.token_delay * fake.tokens)
+                    data = json.dumps({
+                        "id": "chatcmpl-load-test",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "".join(words)},
+                            "finish_reason": "stop",
+                        }],
+                        "usage": usage,
+                    }).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for i, word in enumerate(words):
+                    if i:
+                        time.sleep(fake.token_delay)
+                    chunk = {
+                        "id": "chatcmpl-load-test",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}],
+                    }
+                    if i == len(words) - 1:
+                        chunk["choices"][0]["finish_reason"] = "stop"
+                        chunk["x_groq"] = {"id": "req-load-test", "usage": usage}
+                    self._send_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode())
+                self._send_chunk(b"data: [DONE]\n\n")
+                self._send_chunk(b"")
+
+        return Handler
+
+
+# AppTest 는 인스턴스마다 앱 스크립트를 컴파일하는데, 여러 스레드에서 동시에 compile 하면
+# CPython 3.11 에서 SystemError (AST constructor recursion depth mismatch) 가 날 수 있어 컴파일만 직렬화
+# (실제 서버는 프로세스당 ScriptCache 하나가 한 번만 컴파일하므로 해당 없음)
+def _serialize_script_compile():
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+
+    def locked(self, script_path):
+        with lock:
+            return get_bytecode(self, script_path)
+
+    ScriptCache.get_bytecode = locked
+
+
+def _find(elements, label):
+    for element in elements:
+        if element.label == label:
+            return element
+    raise LookupError(f"위젯을 찾을 수 없습니다: {label}")
+
+
+# 시뮬레이션 고객 한 명의 입력값 (시드로 고정해서 실행마다 같은 값)
+def _profile(rng):
+    return {
+        "연소득 (만원):": int(rng.integers(2000, 15000)),
+        "부양가족 수 (본인 제외):": int(rng.integers(0, 4)),
+        "종목 이름:": str(rng.choice(["삼성전자", "카카오", "NAVER", "현대차"])),
+        "보유 주식 수:": int(rng.integers(1, 500)),
+        "주당 가격 (만원):": float(round(rng.uniform(1, 50), 1)),
+        "월 납입액 (만원):": int(rng.integers(10, 100)),
+        "납입 기간 (년):": int(rng.integers(5, 35)),
+        "보험 이름:": "종신보험",
+        "월 보험료 (만원):": int(rng.integers(5, 40)),
+        "보장 금액 (만원):": int(rng.integers(1000, 20000)),
+    }
+
+
+# 한 사용자의 checklist → input_form → report → chat → download 흐름
+# 실행별 (페이지, 초) 목록과 오류 안내 문구로 끝난 질문의 답변 목록을 돌려줌
+def run_user(index, args):
+    from streamlit.testing.v1 import AppTest
+
+    rng = np.random.default_rng(args.seed + index)
+    samples = []
+    at = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+
+    def timed_run():
+        page = at.session_state["page"] if "page" in at.session_state else "checklist"
+        start = time.perf_counter()
+        at.run()
+        samples.append((page, time.perf_counter() - start))
+        if at.exception:
+            raise RuntimeError(f"사용자 {index} {page} 페이지 오류: {at.exception[0].value}")
+
+    timed_run()
+    at.multiselect[0].set_value(["세금 관리", "투자 관리", "연금 관리", "보험 관리"])
+    timed_run()
+    _find(at.button, "다음 단계로").click()
+    timed_run()
+    timed_run()
+
+    for label, value in _profile(rng).items():
+        element = _find(at.text_input, label) if isinstance(value, str) else _find(at.number_input, label)
+        element.set_value(value)
+    _find(at.button, "보고서 생성").click()
+    timed_run()
+    timed_run()
+
+    _find(at.button, "GPT와 상담 시작").click()
+    timed_run()
+    timed_run()
+
+    questions = random.Random(args.seed + index).sample(QUESTIONS, min(args.questions, len(QUESTIONS)))
+    failed = []
+    for question in questions:
+        # 응답 캐시 적중을 피하려면 사용자마다 다른 질문이 되도록 번호를 붙임
+        at.chat_input[0].set_value(question if args.shared_questions else f"{question} ({index})")
+        answered = len(at.session_state["llm_timings"])
+        timed_run()
+        # 답변(또는 캐시 적중)이면 llm_timings 가 늘어남, 오류면 describe_error 안내 문구만 기록에 남음
+        if len(at.session_state["llm_timings"]) == answered:
+            failed.append(at.session_state["chat_history"][-1]["content"])
+
+    _find(at.button, "최종 보고서 다운로드").click()
+    timed_run()
+    timed_run()
+    return samples, failed
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 상담 세션 부하 테스트 (AppTest + 로컬 가짜 Groq 서버)")
+    parser.add_argument("--users", type=int, default=8, help="동시 사용자 수")
+    parser.add_argument("--rounds", type=int, default=1, help="사용자마다 전체 흐름을 반복하는 횟수")
+    parser.add_argument("--questions", type=int, default=2, help="사용자당 채팅 질문 수")
+    parser.add_argument("--first-token-delay", type=float, default=0.3, help="가짜 Groq 첫 토큰 지연 (초)")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="가짜 Groq 토큰 간 지연 (초)")
+    parser.add_argument("--tokens", type=int, default=40, help="응답 하나의 토큰 수")
+    parser.add_argument("--no-stream", action="store_true", help="GROQ_STREAM=0 으로 실행")
+    parser.add_argument("--backend", choices=["groq", "openai", "stub"], default="groq",
+                        help="가짜 서버를 Groq API 로 부를지 OpenAI 호환 API 로 부를지, 또는 서버 없이 stub 사용")
+    parser.add_argument("--rate-rpm", default="0", help="LLM_RATE_RPM (기본 0 = 앱의 요청 한도 끔, 한도 대기 대신 앱 자체를 측정)")
+    parser.add_argument("--rate-tpm", default="0", help="LLM_RATE_TPM (기본 0 = 제한 없음)")
+    parser.add_argument("--shared-questions", action="store_true", help="모든 사용자가 같은 질문 (응답 캐시 적중)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120, help="AppTest 실행 한 번의 제한 시간 (초)")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장할 경로")
+    args = parser.parse_args()
+
+    server = FakeGroqServer(args.first_token_delay, args.token_delay, args.tokens).start()
+    workdir = tempfile.mkdtemp(prefix="load-test-")
+    # 앱 모듈이 import 되기 전에 설정 (캐시/세션 저장소는 실행마다 새로 만들어 결과를 재현 가능하게)
+    os.environ.update({
+        "GROQ_API_KEY": "load-test",
+        "GROQ_BASE_URL": server.url,
+        "LLM_BACKEND": args.backend,
+        "LLM_BASE_URL": f"{server.url}/v1" if args.backend == "openai" else "",
+        "GROQ_STREAM": "0" if args.no_stream else "1",
+        "LLM_RATE_RPM": args.rate_rpm,
+        "LLM_RATE_TPM": args.rate_tpm,
+        "RESPONSE_CACHE_PATH": os.path.join(workdir, "responses.sqlite3"),
+        "SESSION_STORE_PATH": os.path.join(workdir, "sessions.sqlite3"),
+        "METRICS_PATH": os.path.join(workdir, "metrics.prom"),
+    })
+
+    _serialize_script_compile()
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        jobs = [pool.submit(run_user, user + round_ * args.users, args)
+                for round_ in range(args.rounds) for user in range(args.users)]
+        results = [job.result() for job in jobs]
+    samples = [sample for user_samples, _ in results for sample in user_samples]
+    failed = [reply for _, user_failed in results for reply in user_failed]
+    elapsed = time.perf_counter() - start
+    server.stop()
+
+    flows = args.users * args.rounds
+    result = {
+        "users": args.users,
+        "rounds": args.rounds,
+        "elapsed": elapsed,
+        "flows_per_sec": flows / elapsed,
+        "runs_per_sec": len(samples) / elapsed,
+        "groq_requests": server.requests,
+        "chat_errors": len(failed),
+        "peak_rss_mb": _peak_rss_mb(),
+        "peak_rss_before_mb": rss_before,
+        "pages": {},
+    }
+    print(f"사용자 {args.users}명 × {args.rounds}회, {elapsed:.2f}s, "
+          f"흐름 {result['flows_per_sec']:.2f}/s, 스크립트 실행 {result['runs_per_sec']:.1f}/s, "
+          f"Groq 요청 {server.requests}건")
+    print(f"{'페이지':<12}{'실행 수':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for page in PAGES:
+        times = np.array([seconds for name, seconds in samples if name == page]) * 1000
+        if not times.size:
+            continue
+        p50, p95, p99 = np.percentile(times, [50, 95, 99])
+        result["pages"][page] = {"count": int(times.size), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        print(f"{page:<12}{times.size:>8}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}")
+    print(f"최대 RSS: {result['peak_rss_mb']:.1f}MB (시작 전 {rss_before:.1f}MB)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    # 오류 안내 문구로 끝난 질문이 있으면 측정값을 믿을 수 없으므로 실패로 끝냄
+    if failed:
+        print(f"채팅 오류 {len(failed)}건 (예: {failed[0]})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
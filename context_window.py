@@ -0,0 +1,112 @@
+import os
+import re
+from functools import lru_cache
+
+from sections import SECTION_FIELDS, SECTIONS
+
+# 컨텍스트 창 설정 (환경 변수로 조정)
+KEEP_TURNS = int(os.getenv("CONTEXT_KEEP_TURNS", "6"))  # 그대로 보내는 최근 질문/답변 쌍 수
+FOLD_TURNS = int(os.getenv("CONTEXT_FOLD_TURNS", "3"))  # 한 번에 요약으로 접는 턴 수 (접는 사이에는 앞부분이 유지됨)
+TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "6000"))  # 요청 전체 토큰 상한
+SUMMARY_TOKEN_BUDGET = int(os.getenv("CONTEXT_SUMMARY_TOKEN_BUDGET", "800"))  # 요약 토큰 상한
+SUMMARY_LINE_CHARS = 120  # 요약에 남기는 메시지당 최대 글자 수
+
+MESSAGE_OVERHEAD_TOKENS = 4  # role 등 메시지마다 붙는 토큰
+
+_HANGUL = re.compile(r"[가-힣㄰-㆏]")
+_WORD = re.compile(r"[A-Za-z0-9]+")
+
+
+# 토크나이저 없이 쓰는 토큰 수 추정 (한글은 글자당 약 0.75, 영문/숫자는 4글자당 1, 나머지 기호는 1)
+# 같은 메시지를 매 질문마다 다시 세므로 결과를 캐시
+@lru_cache(maxsize=8192)
+def count_tokens(text):
+    hangul = len(_HANGUL.findall(text))
+    words = _WORD.findall(text)
+    word_chars = sum(len(w) for w in words)
+    other = len(text) - hangul - word_chars - text.count(" ")
+    return int(hangul * 0.75 + sum(max(1, len(w) / 4) for w in words) + max(other, 0) + 0.5)
+
+
+def count_message_tokens(messages):
+    return sum(count_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return " ".join(str(value).split())
+
+
+# user_data 를 한 줄씩 짧게 직렬화, 항목/필드 순서는 SECTION_FIELDS 기준으로 고정
+# (입력 순서나 3.0/3 같은 표기 차이와 관계없이 같은 입력이면 항상 같은 문자열)
+def format_user_data(user_data):
+    lines = []
+    for section in sorted(user_data, key=lambda s: SECTIONS.index(s) if s in SECTIONS else len(SECTIONS)):
+        data = user_data[section]
+        order = list(SECTION_FIELDS.get(section, {}))
+        fields = sorted(data, key=lambda f: order.index(f) if f in order else len(order))
+        lines.append(f"{section}: " + ", ".join(f"{field}={_format_value(data[field])}" for field in fields))
+    return "\n".join(lines)
+
+
+def _summary_line(chat):
+    speaker = "사용자" if chat["role"] == "user" else "GPT"
+    text = " ".join(chat["content"].split())
+    if len(text) > SUMMARY_LINE_CHARS:
+        text = text[:SUMMARY_LINE_CHARS] + "…"
+    return f"- {speaker}: {text}"
+
+
+# 오래된 메시지를 요약 줄로 접어 summary_state 에 누적 (summary_state: {"lines": [...], "folded": n})
+def _fold(chat_history, summary_state, upto):
+    lines = summary_state.setdefault("lines", [])
+    for chat in chat_history[summary_state.get("folded", 0):upto]:
+        lines.append(_summary_line(chat))
+    summary_state["folded"] = max(summary_state.get("folded", 0), upto)
+
+    # 요약이 상한을 넘으면 가장 오래된 줄부터 버림
+    while lines and count_tokens("\n".join(lines)) > SUMMARY_TOKEN_BUDGET:
+        lines.pop(0)
+
+
+# 대화 내내 바뀌지 않는 앞부분 (시스템 프롬프트 + 고객 프로필), 제공자 측 프롬프트 캐시가 이 부분을 재사용
+def prefix_message(system_prompt, user_data):
+    content = system_prompt
+    if user_data:
+        content += "\n\n[고객 보고서]\n" + format_user_data(user_data)
+    return {"role": "system", "content": content}
+
+
+# 상담이 길어지면 바뀌는 요약은 고정 앞부분 뒤에 별도 메시지로 둠
+def _summary_messages(summary_state):
+    if not summary_state.get("lines"):
+        return []
+    return [{"role": "system", "content": "[이전 상담 요약]\n" + "\n".join(summary_state["lines"])}]
+
+
+# 토큰 예산 안에서 보낼 메시지 목록을 만들고 (messages, 추정 토큰 수) 를 돌려줌
+def build_messages(system_prompt, user_data, chat_history, summary_state):
+    # 기록이 초기화되었으면 요약도 새로 시작
+    if summary_state.get("folded", 0) > len(chat_history):
+        summary_state.clear()
+
+    # 새 질문 앞의 기록이 KEEP_TURNS + FOLD_TURNS 턴을 넘으면 KEEP_TURNS 턴만 남기고 한꺼번에 요약으로 접음
+    # 매 턴 한 칸씩 밀지 않으므로 접는 사이의 요청들은 앞부분이 같아 프롬프트 캐시에 걸림
+    split = summary_state.get("folded", 0)
+    if len(chat_history) - 1 - split > (KEEP_TURNS + FOLD_TURNS) * 2:
+        split = len(chat_history) - 1 - KEEP_TURNS * 2
+    split = min(split, max(len(chat_history) - 1, 0))
+    _fold(chat_history, summary_state, split)
+    prefix = prefix_message(system_prompt, user_data)
+    messages = [prefix, *_summary_messages(summary_state), *chat_history[split:]]
+    tokens = count_message_tokens(messages)
+
+    # 예산을 넘으면 최신 질문 하나만 남을 때까지 오래된 메시지를 더 접음
+    while tokens > TOKEN_BUDGET and split < len(chat_history) - 1:
+        split += 1
+        _fold(chat_history, summary_state, split)
+        messages = [prefix, *_summary_messages(summary_state), *chat_history[split:]]
+        tokens = count_message_tokens(messages)
+
+    return messages, tokens
@@ -0,0 +1,381 @@
+import argparse
+import hashlib
+import html
+import inspect
+import itertools
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+
+import research_common  # noqa: E402
+from research_common import FIGURES, PAGE_STYLE, SECTIONS  # noqa: E402
+from research_data import load_frame, table_digest  # noqa: E402
+
+# 리서치 보고서를 정적 HTML/PDF 로 내보내기
+# 보기만 하는 독자는 Streamlit 세션 없이 CDN/nginx 가 주는 파일을 읽음
+# 그림은 (그림 이름, 파라미터, 입력 표 내용, 그림 함수 코드)가 같으면 이전 결과를 그대로 씀
+EXPORT_CACHE_DIR = os.getenv("RESEARCH_EXPORT_CACHE_DIR", os.path.join(".cache", "research_export"))
+REPORT_TITLE = "2025 핀테크 산업 리서치 보고서"
+
+# 앱은 Streamlit 테마(자리표시 색 '#000001' 등을 화면에서 테마 색으로 바꿈)로 그림을 만들지만
+# 정적 파일에는 색을 바꿔 줄 화면이 없으므로 plotly 기본 테마로 다시 만듦
+STATIC_TEMPLATE = "plotly"
+
+# 페이지를 실행할 때 그림 자리에 남기는 표시 (그림은 따로 만들어 끼워 넣음)
+FIGURE_MARK = "@@research-figure:"
+
+EXPORT_STYLE = """
+<style>
+    body { font-family: sans-serif; max-width: 1200px; margin: 0 auto; padding: 1rem 2rem; line-height: 1.6; }
+    nav ul { list-style: none; padding: 0; display: flex; flex-wrap: wrap; gap: 0.5rem 1.5rem; }
+    section { border-top: 1px solid #E5E7EB; padding-top: 1rem; }
+    .columns { display: flex; gap: 1.5rem; }
+    .tab-label { color: #2563EB; }
+    .figure { width: 100%; min-height: 350px; }
+    table { border-collapse: collapse; }
+    th, td { border: 1px solid #E5E7EB; padding: 0.3rem 0.6rem; }
+</style>
+"""
+
+
+def _markdown():
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt("commonmark", {"html": True}).enable("table")
+
+
+# 페이지 모듈을 화면 없이 실행해서 요소 목록으로 바꿈
+# ("markdown", 본문) / ("caption", 본문) / ("table", DataFrame) / ("figure", 이름, 파라미터)
+# ("columns", [(비율, 요소들), ...]) / ("tabs", [(이름, 요소들), ...])
+def run_section(path):
+    from streamlit.testing.v1 import AppTest
+
+    figures = []
+    show_figure = research_common.show_figure
+
+    def record_figure(name, **params):
+        import streamlit as st
+
+        st.markdown(f"{FIGURE_MARK}{len(figures)}")
+        figures.append((name, params))
+
+    # 페이지 모듈은 실행마다 research_common 에서 show_figure 를 다시 가져오므로 여기서 바꿔 끼우면 됨
+    research_common.show_figure = record_figure
+    try:
+        at = AppTest.from_file(os.path.join(ROOT, path), default_timeout=120)
+        at.run()
+    finally:
+        research_common.show_figure = show_figure
+    if at.exception:
+        raise RuntimeError(f"{path} 실행 중 오류: {at.exception[0].message}")
+
+    def convert(node):
+        kind = type(node).__name__
+        if kind == "Markdown":
+            if node.value.startswith(FIGURE_MARK):
+                return [("figure", *figures[int(node.value[len(FIGURE_MARK):])])]
+            return [("markdown", node.value)]
+        if kind == "Caption":
+            return [("caption", node.value)]
+        if kind == "Table":
+            return [("table", node.value)]
+        if kind == "Block" and node.type == "flex_container" and all(type(child).__name__ == "Column" for child in node.children.values()):
+            return [("columns", [(column.proto.weight, convert(column)) for column in node.children.values()])]
+        if kind == "Block" and node.type == "tab_container":
+            return [("tabs", [(tab.label, convert(tab)) for tab in node.children.values()])]
+        # 그 밖의 컨테이너(본문, 일반 블록, 열/탭 안쪽)는 자식을 순서대로 펼침
+        return [item for child in getattr(node, "children", {}).values() for item in convert(child)]
+
+    return convert(at.main)
+
+
+def _figure_key(name, params):
+    builder, tables = FIGURES[name]
+    raw = json.dumps({
+        "name": name,
+        "params": params,
+        "tables": {table: table_digest(table) for table in tables},
+        "code": inspect.getsource(builder),
+        "template": STATIC_TEMPLATE,
+    }, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def _static_figure(name, params):
+    import plotly.io as pio
+
+    builder, tables = FIGURES[name]
+    template = pio.templates.default
+    pio.templates.default = STATIC_TEMPLATE
+    try:
+        return builder({table: load_frame(table) for table in tables}, **params)
+    finally:
+        pio.templates.default = template
+
+
+# 점/막대 위 글자 (texttemplate 의 %{text} 만 지원, 정수인 실수는 정수로)
+def _label(trace, value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return trace.texttemplate.replace("%{text}", str(value)) if trace.texttemplate else str(value)
+
+
+# plotly 색 ('#636efa', 'rgb(55, 83, 109)') -> matplotlib 색 (숫자 배열 등 색 이름이 아니면 None = 기본색)
+def _mpl_color(value):
+    if not isinstance(value, str):
+        return None
+    if value.startswith("rgb"):
+        from plotly.colors import unlabel_rgb
+
+        return tuple(channel / 255 for channel in unlabel_rgb(value)[:3])
+    return value
+
+
+# plotly 그림을 PDF 용 PNG 로 (kaleido 없이 matplotlib 으로 막대/선/점 trace 만 다시 그림)
+def _figure_png(fig, path):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    from pdf_report import find_report_font
+
+    font_path = find_report_font()
+    font_manager.fontManager.addfont(font_path)
+    plt.rcParams["font.family"] = font_manager.FontProperties(fname=font_path).get_name()
+    plt.rcParams["axes.unicode_minus"] = False
+
+    figure, ax = plt.subplots(figsize=(9, 4.5), dpi=150)
+    axes = {"y": ax}
+    for trace in fig.data:
+        target = ax
+        if getattr(trace, "yaxis", None) == "y2":
+            target = axes.setdefault("y2", ax.twinx())
+        x = list(trace.x) if trace.x is not None else []
+        y = list(trace.y) if trace.y is not None else []
+        if trace.type == "bar":
+            color = _mpl_color(trace.marker.color)
+            target.bar(x, y, color=color, label=trace.name)
+        elif trace.type == "scatter":
+            mode = trace.mode or "markers"
+            color = _mpl_color(trace.line.color) or _mpl_color(trace.marker.color)
+            if "lines" in mode:
+                target.plot(x, y, color=color, marker="o" if "markers" in mode else None, label=trace.name)
+            elif "markers" in mode:
+                target.scatter(x, y, color=color, s=120, alpha=0.8, label=trace.name)
+        else:
+            continue
+        if trace.text is not None and not isinstance(trace.text, str):
+            for xi, yi, text in zip(x, y, trace.text):
+                target.annotate(_label(trace, text), (xi, yi), textcoords="offset points", xytext=(0, 6), ha="center", fontsize=7)
+
+    layout = fig.layout
+    ax.set_title(layout.title.text or "")
+    ax.set_xlabel(layout.xaxis.title.text or "")
+    ax.set_ylabel(layout.yaxis.title.text or "")
+    if "y2" in axes:
+        axes["y2"].set_ylabel(layout.yaxis2.title.text or "")
+    named = [trace for trace in fig.data if trace.name]
+    if len(named) > 1 and layout.showlegend is not False:
+        handles = [handle for axis in axes.values() for handle in axis.get_legend_handles_labels()[0]]
+        ax.legend(handles=handles, fontsize=7, loc="upper left")
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
+
+
+# 그림 하나를 내보내기 캐시에 준비 (입력이 그대로면 다시 만들지 않음)
+# PNG 는 PDF 를 만들 때만 필요 (보고서 폰트로 그리므로 폰트가 없으면 만들지 않음)
+def export_figure(name, params, stats, png=True):
+    key = _figure_key(name, params)
+    spec_path = os.path.join(EXPORT_CACHE_DIR, f"{key}.json")
+    png_path = os.path.join(EXPORT_CACHE_DIR, f"{key}.png")
+    if os.path.exists(spec_path) and (not png or os.path.exists(png_path)):
+        stats["reused"] += 1
+    else:
+        fig = _static_figure(name, params)
+        os.makedirs(EXPORT_CACHE_DIR, exist_ok=True)
+        if png:
+            _figure_png(fig, f"{png_path}.tmp.png")
+            os.replace(f"{png_path}.tmp.png", png_path)
+        with open(f"{spec_path}.tmp", "w", encoding="utf-8") as f:
+            f.write(fig.to_json())
+        os.replace(f"{spec_path}.tmp", spec_path)
+        stats["built"] += 1
+    with open(spec_path, encoding="utf-8") as f:
+        return f.read(), png_path if png else None
+
+
+def _section_html(items, figures, md, ids):
+    parts = []
+    for item in items:
+        kind = item[0]
+        if kind == "markdown":
+            parts.append(md.render(item[1]))
+        elif kind == "caption":
+            parts.append(f'<p class="caption">{html.escape(item[1])}</p>')
+        elif kind == "table":
+            parts.append(item[1].to_html(border=0))
+        elif kind == "figure":
+            spec, _ = figures[(item[1], json.dumps(item[2], sort_keys=True))]
+            figure_id = f"figure-{next(ids)}"
+            # </script> 가 JSON 안에 있어도 스크립트가 끊기지 않도록
+            data = spec.replace("</", "<\\/")
+            parts.append(
+                f'<div id="{figure_id}" class="figure"></div>\n'
+                f'<script>(function () {{ var spec = {data}; '
+                f'Plotly.newPlot("{figure_id}", spec.data, spec.layout, {{responsive: true}}); }})();</script>'
+            )
+        elif kind == "columns":
+            columns = "".join(
+                f'<div class="column" style="flex: {weight}">{_section_html(children, figures, md, ids)}</div>'
+                for weight, children in item[1]
+            )
+            parts.append(f'<div class="columns">{columns}</div>')
+        elif kind == "tabs":
+            for label, children in item[1]:
+                parts.append(f'<h4 class="tab-label">{html.escape(label)}</h4>{_section_html(children, figures, md, ids)}')
+    return "\n".join(parts)
+
+
+# plotly.js 는 한 번만 넣고 그림마다 직렬화된 JSON 만 넣은 단일 HTML 파일
+def build_html(sections, figures):
+    from plotly.offline import get_plotlyjs
+
+    md = _markdown()
+    ids = itertools.count(1)
+    toc = "".join(f'<li><a href="#{url_path}">{html.escape(title)}</a></li>' for _, title, url_path, _ in sections)
+    body = "\n".join(
+        f'<section id="{url_path}">\n{_section_html(items, figures, md, ids)}\n</section>'
+        for _, _, url_path, items in sections
+    )
+    return (
+        f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        f'<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f"<title>{REPORT_TITLE}</title>\n{PAGE_STYLE}{EXPORT_STYLE}"
+        f'<script type="text/javascript">{get_plotlyjs()}</script>\n</head>\n<body>\n'
+        f"<h1>{REPORT_TITLE}</h1>\n<nav><ul>{toc}</ul></nav>\n{body}\n</body>\n</html>\n"
+    )
+
+
+# 앱의 CSS 제목 클래스 -> PDF 제목 태그 (write_html 은 class 를 쓰지 않음)
+PDF_HEADINGS = {"main-header": "h1", "section-header": "h2", "subsection-header": "h3"}
+
+
+def _pdf_items(pdf, items, figures, md):
+    from fpdf.enums import XPos, YPos
+
+    for item in items:
+        kind = item[0]
+        if kind == "markdown":
+            # 앱 전용 HTML 래퍼(div)는 PDF 에서 의미가 없으므로 뺌
+            text = "\n".join(line for line in item[1].splitlines() if not line.strip().startswith(("<div", "</div")))
+            for css_class, tag in PDF_HEADINGS.items():
+                text = re.sub(rf'<p class="{css_class}">(.*?)</p>', rf"<{tag}>\1</{tag}>", text)
+            if text.strip():
+                pdf.write_html(md.render(text))
+        elif kind == "caption":
+            pdf.set_font(size=8)
+            pdf.multi_cell(0, 5, text=item[1], new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            pdf.set_font(size=10)
+            pdf.ln(2)
+        elif kind == "table":
+            frame = item[1].reset_index()
+            with pdf.table(text_align="LEFT") as table:
+                for row in [list(frame.columns), *frame.values.tolist()]:
+                    cells = table.row()
+                    for value in row:
+                        cells.cell(str(value))
+            pdf.ln(3)
+        elif kind == "figure":
+            _, png_path = figures[(item[1], json.dumps(item[2], sort_keys=True))]
+            pdf.image(png_path, w=pdf.epw)
+            pdf.ln(3)
+        elif kind == "columns":
+            # PDF 는 세로로 이어서 씀
+            for _, children in item[1]:
+                _pdf_items(pdf, children, figures, md)
+        elif kind == "tabs":
+            for label, children in item[1]:
+                pdf.write_html(f"<h4>{html.escape(label)}</h4>")
+                _pdf_items(pdf, children, figures, md)
+
+
+# 최종 보고서 PDF 와 같은 폰트로 섹션마다 새 페이지
+def build_pdf(sections, figures):
+    from fpdf import FPDF
+
+    from pdf_report import FONT_FAMILY, add_report_font, add_report_font_styles, check_report_font
+
+    problem = check_report_font()
+    if problem:
+        raise RuntimeError(problem)
+    md = _markdown()
+    pdf = FPDF()
+    add_report_font(pdf)
+    add_report_font_styles(pdf)
+    pdf.set_font(FONT_FAMILY, size=10)
+    for _, title, _, items in sections:
+        pdf.add_page()
+        pdf.set_font(size=10)
+        _pdf_items(pdf, items, figures, md)
+    pdf.set_title(REPORT_TITLE)
+    return bytes(pdf.output())
+
+
+def _write(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리서치 보고서 여섯 섹션을 정적 HTML/PDF 로 내보내기")
+    parser.add_argument("--out", default="research_export", help="출력 디렉터리 (index.html, research_report.pdf)")
+    parser.add_argument("--no-pdf", action="store_true", help="HTML 만 만들기")
+    args = parser.parse_args()
+
+    # PDF 는 한글 보고서 폰트가 있어야 만들 수 있으므로 페이지를 실행하기 전에 확인
+    if not args.no_pdf:
+        from pdf_report import check_report_font
+
+        problem = check_report_font()
+        if problem:
+            parser.error(f"{problem}\nPDF 없이 HTML 만 만들려면 --no-pdf 를 주세요.")
+
+    start = time.perf_counter()
+    sections = [(path, title, url_path, run_section(path)) for path, title, url_path in SECTIONS]
+
+    stats = {"built": 0, "reused": 0}
+    figures = {}
+
+    def collect(items):
+        for item in items:
+            if item[0] == "figure":
+                key = (item[1], json.dumps(item[2], sort_keys=True))
+                if key not in figures:
+                    figures[key] = export_figure(item[1], item[2], stats, png=not args.no_pdf)
+            elif item[0] in ("columns", "tabs"):
+                for _, children in item[1]:
+                    collect(children)
+
+    for *_, items in sections:
+        collect(items)
+
+    os.makedirs(args.out, exist_ok=True)
+    _write(os.path.join(args.out, "index.html"), build_html(sections, figures).encode("utf-8"))
+    if not args.no_pdf:
+        _write(os.path.join(args.out, "research_report.pdf"), build_pdf(sections, figures))
+    print(f"{args.out} 에 내보내기 완료: 그림 {stats['built'] + stats['reused']}개 중 "
+          f"{stats['built']}개 새로 만듦, {stats['reused']}개 재사용 ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
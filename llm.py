@@ -0,0 +1,640 @@
+import hashlib
+import itertools
+import json
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import streamlit as st
+from groq import Groq, APIConnectionError, APIStatusError, APITimeoutError
+
+from context_window import count_message_tokens
+
+SYSTEM_PROMPT = "너는 사람들에게 유능한 Wrap Account를 해주는 펀드 매니저야, 너의 고객은 한국 사람밖에 없으니 한국말로만 대답을 해야해 그렇지 않으면 너의 직업은 위태로워"
+
+# LLM 백엔드 설정 (환경 변수로 선택)
+#  LLM_BACKEND: groq (기본) | openai (OpenAI 호환 서버, 예: llama.cpp 의 /v1) | stub (네트워크 없이 고정 응답)
+#  LLM_BASE_URL, LLM_MODEL, LLM_API_KEY: 주소/모델/키 (groq 는 GROQ_API_KEY 를 기본으로 사용)
+#  LLM_FAST_BACKEND 등 LLM_FAST_* 로 두 번째 백엔드를 지정하면 LLM_FAST_MAX_CHARS 이하의 짧은 질문은 그쪽으로 보냄
+DEFAULT_MODELS = {"groq": "llama-3.3-70b-versatile", "openai": "local-model", "stub": "stub"}
+LLM_FAST_MAX_CHARS = int(os.getenv("LLM_FAST_MAX_CHARS", "40"))
+LLM_STUB_DELAY = float(os.getenv("LLM_STUB_DELAY", "0"))  # stub 의 토큰 간 지연 (초)
+
+
+def backend_settings(route="main"):
+    prefix = "LLM_FAST" if route == "fast" else "LLM"
+    backend = os.getenv(f"{prefix}_BACKEND", "" if route == "fast" else "groq")
+    if not backend:
+        return None
+    if backend not in DEFAULT_MODELS:
+        raise ValueError(f"알 수 없는 {prefix}_BACKEND 값입니다: {backend!r}")
+    api_key = os.getenv(f"{prefix}_API_KEY") or (os.getenv("GROQ_API_KEY") if backend == "groq" else None)
+    return {
+        "backend": backend,
+        "base_url": os.getenv(f"{prefix}_BASE_URL") or None,
+        "model": os.getenv(f"{prefix}_MODEL", DEFAULT_MODELS[backend]),
+        "api_key": api_key,
+    }
+
+
+MODEL_NAME = backend_settings()["model"]
+
+# 연결 풀/타임아웃/동시 요청 수 설정 (환경 변수로 조정, 모든 백엔드 공통)
+GROQ_TIMEOUT = float(os.getenv("GROQ_TIMEOUT", "60"))
+GROQ_CONNECT_TIMEOUT = float(os.getenv("GROQ_CONNECT_TIMEOUT", "5"))
+GROQ_MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "20"))
+GROQ_KEEPALIVE_EXPIRY = float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "30"))
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+
+# 429/5xx 재시도 설정
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "3"))
+GROQ_BACKOFF_BASE = float(os.getenv("GROQ_BACKOFF_BASE", "0.5"))
+GROQ_BACKOFF_MAX = float(os.getenv("GROQ_BACKOFF_MAX", "8"))
+
+# 요청 한도 (프로세스당, 0 이면 제한 없음). groq 기본값은 llama-3.3-70b-versatile 무료 등급 한도
+# 서버 프로세스를 여러 개 띄우면 전체 한도를 프로세스 수로 나눠 LLM_RATE_RPM/LLM_RATE_TPM 에 지정
+DEFAULT_RATE_LIMITS = {"groq": (30, 12000)}
+LLM_RATE_COMPLETION_TOKENS = int(os.getenv("LLM_RATE_COMPLETION_TOKENS", "512"))  # 응답 토큰 예상치 (끝나면 실제 값으로 정산)
+LLM_RATE_BURST_SECONDS = float(os.getenv("LLM_RATE_BURST_SECONDS", "60"))  # 몰아 쓸 수 있는 한도 (몇 초치)
+LLM_COALESCE = os.getenv("LLM_COALESCE", "1") != "0"  # 같은 요청 합치기
+
+# 요청 우선순위 (작을수록 먼저)
+PRIORITY_INTERACTIVE = 0  # 사용자가 기다리는 상담 질문
+PRIORITY_BACKGROUND = 1  # 선행 요청, 배치 보고서
+
+_DONE = object()
+
+
+def _http_client():
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=GROQ_MAX_CONNECTIONS,
+            max_keepalive_connections=GROQ_MAX_CONNECTIONS,
+            keepalive_expiry=GROQ_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(GROQ_TIMEOUT, connect=GROQ_CONNECT_TIMEOUT),
+    )
+
+
+def _namespace(value):
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_namespace(v) for v in value]
+    return value
+
+
+def _completion_chunk(data):
+    for choice in data.get("choices", []):
+        choice.setdefault("delta", {}).setdefault("content", None)
+    data.setdefault("usage", None)
+    return _namespace(data)
+
+
+# OpenAI 호환 /chat/completions 클라이언트 (Groq SDK 와 같은 모양의 응답 객체를 돌려줌)
+class OpenAICompatibleClient:
+    def __init__(self, base_url, api_key, http_client):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.http = http_client
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages, model, stream=False, timeout=None):
+        body = {"model": model, "messages": messages, "stream": stream}
+        if not stream:
+            response = self.http.post(self.url, json=body, headers=self.headers, timeout=timeout)
+            response.raise_for_status()
+            # usage 를 빼고 보내는 서버도 있으므로 스트리밍 청크와 같이 기본값을 채움
+            data = response.json()
+            data.setdefault("usage", None)
+            return _namespace(data)
+
+        body["stream_options"] = {"include_usage": True}
+        request = self.http.build_request("POST", self.url, json=body, headers=self.headers, timeout=timeout)
+        response = self.http.send(request, stream=True)
+        if response.is_error:
+            response.read()
+            response.close()
+            response.raise_for_status()
+        return _SSEStream(response)
+
+
+# Server-Sent Events 응답을 청크 객체로 하나씩 넘겨줌
+class _SSEStream:
+    def __init__(self, response):
+        self.response = response
+
+    def __iter__(self):
+        for line in self.response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+            yield _completion_chunk(json.loads(payload))
+
+    def close(self):
+        self.response.close()
+
+
+# 네트워크 없이 같은 질문에 항상 같은 답을 돌려주는 테스트/벤치마크용 백엔드
+class StubClient:
+    def __init__(self, delay=LLM_STUB_DELAY):
+        self.delay = delay
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages, model, stream=False, timeout=None):
+        question = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+        digest = hashlib.sha256(question.encode("utf-8")).hexdigest()[:8]
+        text = f"[오프라인 응답 {digest}] '{question[:40]}' 에 대한 테스트 답변입니다."
+        words = [word + " " for word in text.split(" ")]
+        usage = SimpleNamespace(prompt_tokens=count_message_tokens(messages), completion_tokens=len(words))
+        if not stream:
+            time.sleep(self.delay * len(words))
+            message = SimpleNamespace(role="assistant", content="".join(words))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+        return self._stream(words, usage)
+
+    def _stream(self, words, usage):
+        for i, word in enumerate(words):
+            if i and self.delay:
+                time.sleep(self.delay)
+            last = i == len(words) - 1
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=word))],
+                usage=usage if last else None,
+                x_groq=None,
+            )
+
+
+# 서버 프로세스당 경로(main/fast)별 클라이언트 하나를 만들어 모든 세션이 keep-alive 연결 풀을 공유
+@st.cache_resource(show_spinner=False)
+def get_llm_client(route="main"):
+    settings = backend_settings(route)
+    if settings["backend"] == "stub":
+        return StubClient()
+    if settings["backend"] == "openai":
+        if not settings["base_url"]:
+            raise ValueError("LLM_BACKEND=openai 는 LLM_BASE_URL 이 필요합니다 (예: http://localhost:8080/v1).")
+        return OpenAICompatibleClient(settings["base_url"], settings["api_key"], _http_client())
+    # 재시도는 아래 워커에서 지터 백오프로 직접 처리
+    return Groq(
+        api_key=settings["api_key"],
+        base_url=settings["base_url"],
+        http_client=_http_client(),
+        max_retries=0,
+    )
+
+
+# 짧은 질문은 LLM_FAST_* 백엔드가 설정되어 있으면 그쪽으로 보냄
+def choose_route(question):
+    if backend_settings("fast") is not None and len(question.strip()) <= LLM_FAST_MAX_CHARS:
+        return "fast"
+    return "main"
+
+
+# API 키가 없어 호출할 수 없는 백엔드인지 확인 (stub/로컬 서버는 키 없이 사용)
+def llm_available(route="main"):
+    settings = backend_settings(route)
+    return settings is not None and (settings["backend"] != "groq" or bool(settings["api_key"]))
+
+
+# 모든 세션이 공유하는 LLM 호출 워커 풀 (동시 요청 수 = 워커 수)
+@st.cache_resource(show_spinner=False)
+def _get_executor():
+    return ThreadPoolExecutor(max_workers=GROQ_MAX_CONCURRENCY, thread_name_prefix="groq")
+
+
+def rate_limits(route="main"):
+    prefix = "LLM_FAST" if route == "fast" else "LLM"
+    rpm, tpm = DEFAULT_RATE_LIMITS.get(backend_settings(route)["backend"], (0, 0))
+    return float(os.getenv(f"{prefix}_RATE_RPM", rpm)), float(os.getenv(f"{prefix}_RATE_TPM", tpm))
+
+
+# 분당 한도를 초당 속도로 채우는 토큰 버킷 (최대 burst_seconds 초치까지 몰아 쓸 수 있음)
+class TokenBucket:
+    def __init__(self, per_minute, burst_seconds=LLM_RATE_BURST_SECONDS):
+        self.rate = per_minute / 60
+        self.capacity = max(self.rate * burst_seconds, 1)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    # amount 만큼 쓸 수 있을 때까지 기다려야 하는 시간 (초)
+    def wait(self, amount):
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+
+# 분당 요청 수 + 분당 토큰 수 한도, 429 를 받으면 retry-after 동안 전체를 멈춤
+# 호출하는 쪽(LLMScheduler)의 잠금 안에서만 사용
+class RateLimiter:
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.paused_until = 0.0
+
+    # 지금 보낼 수 있으면 한도를 차감하고 0, 아니면 기다릴 시간 (초)
+    def reserve(self, tokens):
+        now = time.monotonic()
+        wait = max(self.paused_until - now, 0.0)
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                wait = max(wait, bucket.wait(amount))
+        if wait > 0:
+            return wait
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is not None:
+                bucket.level -= amount
+        return 0.0
+
+    # 예상치와 실제 사용량의 차이를 정산 (음수가 되면 다음 요청이 그만큼 기다림)
+    def adjust(self, tokens):
+        if self.tokens is not None:
+            self.tokens.level -= tokens
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+# 프로세스 공용 LLM 요청 스케줄러
+#  - 경로(main/fast)별 RateLimiter 한도 안에서만 워커 풀로 보냄
+#  - 대기 중 요청은 우선순위 → 가장 오래전에 차례가 돌아간 세션 → 도착 순으로 골라 세션 간 공정하게 처리
+#  - 같은 모델/메시지의 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 나눠 받음 (single-flight)
+class LLMScheduler:
+    def __init__(self, executor, max_concurrency=GROQ_MAX_CONCURRENCY):
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.stats = {"submitted": 0, "coalesced": 0, "dispatched": 0, "rate_limited": 0}
+        self._cond = threading.Condition()
+        self._pending = []
+        self._flights = {}
+        self._last_served = {}
+        self._limiters = {}
+        self._inflight = 0
+        self._seq = itertools.count()
+        threading.Thread(target=self._dispatch, daemon=True, name="llm-scheduler").start()
+
+    def _limiter(self, route):
+        if route not in self._limiters:
+            self._limiters[route] = RateLimiter(*rate_limits(route))
+        return self._limiters[route]
+
+    # 요청을 등록하고 완료 시점을 알려주는 Future 를 돌려줌 (진행 중인 같은 요청이 있으면 그 Future)
+    def submit(self, request):
+        with self._cond:
+            self.stats["submitted"] += 1
+            leader = self._flights.get(request.flight_key) if LLM_COALESCE else None
+            if leader is not None and leader.attach(request):
+                self.stats["coalesced"] += 1
+                # 뒤에 온 요청이 더 급하면 앞선 요청의 우선순위를 올림
+                leader.priority = min(leader.priority, request.priority)
+                self._cond.notify_all()
+                return leader.future
+            request.seq = next(self._seq)
+            if LLM_COALESCE:
+                self._flights[request.flight_key] = request
+            self._pending.append(request)
+            self._cond.notify_all()
+            return request.future
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def pause(self, route, seconds):
+        with self._cond:
+            self.stats["rate_limited"] += 1
+            self._limiter(route).pause(seconds)
+            self._cond.notify_all()
+
+    def _dispatch(self):
+        with self._cond:
+            while True:
+                for request in [r for r in self._pending if r.future.cancelled()]:
+                    self._pending.remove(request)
+                    if self._flights.get(request.flight_key) is request:
+                        del self._flights[request.flight_key]
+                if not self._pending or self._inflight >= self.max_concurrency:
+                    self._cond.wait()
+                    continue
+                # 경로마다 순서가 가장 앞선 요청만 한도를 확인하고, 한도에 여유가 있는 경로의 요청을 보냄
+                # (한도에 걸린 main 요청이 제한 없는 fast 경로 요청까지 막지 않도록)
+                request = None
+                waits = {}
+                for candidate in sorted(
+                    self._pending,
+                    key=lambda r: (r.priority, self._last_served.get(r.owner, 0.0), r.seq),
+                ):
+                    if candidate.route in waits:
+                        continue
+                    wait = self._limiter(candidate.route).reserve(candidate.estimated_tokens)
+                    if wait <= 0:
+                        request = candidate
+                        break
+                    waits[candidate.route] = wait
+                if request is None:
+                    # 가장 먼저 여유가 생기는 경로까지만 기다림 (새 요청/완료/취소가 오면 그 전에 깨어남)
+                    self._cond.wait(min(waits.values()))
+                    continue
+                self._pending.remove(request)
+                self._inflight += 1
+                self._last_served[request.owner] = time.monotonic()
+                self.stats["dispatched"] += 1
+                self.executor.submit(self._execute, request)
+
+                # 오래 요청이 없던 세션 기록은 정리
+                if len(self._last_served) > 10000:
+                    cutoff = time.monotonic() - 3600
+                    self._last_served = {k: v for k, v in self._last_served.items() if v > cutoff}
+
+    def _execute(self, request):
+        try:
+            if request.future.set_running_or_notify_cancel():
+                try:
+                    request._run()
+                    request.future.set_result(None)
+                except BaseException as e:
+                    request.future.set_exception(e)
+        finally:
+            used = request.timing.get("prompt_tokens", 0) + request.timing.get("completion_tokens", 0)
+            with self._cond:
+                self._inflight -= 1
+                if self._flights.get(request.flight_key) is request:
+                    del self._flights[request.flight_key]
+                if used:
+                    self._limiter(request.route).adjust(used - request.estimated_tokens)
+                self._cond.notify_all()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_scheduler():
+    return LLMScheduler(_get_executor())
+
+
+def _status_code(error):
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    return getattr(error, "status_code", None)
+
+
+def _is_rate_limited(error):
+    return _status_code(error) == 429
+
+
+def _is_retryable(error):
+    if isinstance(error, (APIConnectionError, APITimeoutError, httpx.TransportError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, APIStatusError) and (error.status_code == 429 or error.status_code >= 500)
+
+
+# 화면에 보여줄 오류 문구 (한도 초과/시간 초과/연결 실패는 원문 대신 안내 문구)
+def describe_error(error, backend="LLM"):
+    if _is_rate_limited(error):
+        return "요청이 많아 답변이 지연되고 있습니다. 잠시 후 다시 질문해주세요."
+    if isinstance(error, (TimeoutError, APITimeoutError, httpx.TimeoutException)):
+        return "응답 시간이 초과되었습니다. 잠시 후 다시 질문해주세요."
+    if isinstance(error, (APIConnectionError, httpx.TransportError)):
+        return f"{backend} 서버에 연결할 수 없습니다. 잠시 후 다시 질문해주세요."
+    return f"{backend} API 호출 중 오류가 발생했습니다: {error}"
+
+
+# 지수 백오프 + full jitter, 서버가 retry-after 를 주면 그 이상 기다림
+def _backoff_delay(attempt, error):
+    delay = random.uniform(0, min(GROQ_BACKOFF_MAX, GROQ_BACKOFF_BASE * 2 ** attempt))
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            delay = max(delay, float(response.headers.get("retry-after", 0)))
+        except ValueError:
+            pass
+    return delay
+
+
+# 응답에 포함된 실제 토큰 사용량 기록
+def _record_usage(timing, usage):
+    if usage is None:
+        return
+    timing["prompt_tokens"] = usage.prompt_tokens
+    timing["completion_tokens"] = usage.completion_tokens
+
+
+# 워커 스레드에서 실행되는 LLM 호출 하나 (토큰은 큐로 전달)
+# 같은 요청이 이미 진행 중이면 그 요청(leader)의 토큰을 처음부터 나눠 받음
+class LLMRequest:
+    def __init__(self, client, messages, stream, timeout=GROQ_TIMEOUT, model=MODEL_NAME,
+                 route="main", priority=PRIORITY_INTERACTIVE, owner=None):
+        self.client = client
+        self.messages = messages
+        self.model = model
+        self.stream = stream
+        self.route = route
+        self.priority = priority
+        self.owner = owner
+        self.timing = {"retries": 0}
+        self.tokens = queue.Queue()
+        self.cancelled = threading.Event()
+        self.submitted = time.perf_counter()
+        self.deadline = self.submitted + timeout
+        self.estimated_tokens = count_message_tokens(messages) + LLM_RATE_COMPLETION_TOKENS
+        raw = json.dumps([route, model, messages], ensure_ascii=False, sort_keys=True)
+        self.flight_key = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        self.leader = None
+        self._sinks = [self.tokens]
+        self._emitted = []
+        self._sink_lock = threading.Lock()
+        self.future = Future()
+        self.future = _get_scheduler().submit(self)
+
+    # 진행 중인 이 요청의 결과를 follower 도 받도록 등록 (이미 취소된 요청이면 False)
+    def attach(self, follower):
+        with self._sink_lock:
+            if self.cancelled.is_set():
+                return False
+            for item in self._emitted:
+                follower.tokens.put(item)
+            self._sinks.append(follower.tokens)
+        follower.leader = self
+        follower.timing["coalesced"] = True
+        return True
+
+    def _emit(self, item):
+        with self._sink_lock:
+            self._emitted.append(item)
+            for sink in self._sinks:
+                sink.put(item)
+
+    # 받는 쪽이 모두 떠났을 때만 실제 요청을 취소
+    def _detach(self, sink):
+        with self._sink_lock:
+            self._sinks = [s for s in self._sinks if s is not sink]
+            if self._sinks:
+                return
+            self.cancelled.set()
+        self.future.cancel()
+        _get_scheduler().wake()
+
+    def cancel(self):
+        (self.leader or self)._detach(self.tokens)
+
+    def done(self):
+        return self.future.done()
+
+    def _remaining(self):
+        return self.deadline - time.perf_counter()
+
+    def _run(self):
+        self.timing["queue_wait"] = time.perf_counter() - self.submitted
+        attempt = 0
+        emitted = False
+        while not self.cancelled.is_set():
+            try:
+                if self.stream:
+                    response = self.client.chat.completions.create(
+                        messages=self.messages,
+                        model=self.model,
+                        stream=True,
+                        timeout=max(self._remaining(), 0.1),
+                    )
+                    try:
+                        for chunk in response:
+                            if self.cancelled.is_set():
+                                break
+                            # Groq 는 마지막 청크의 x_groq.usage, OpenAI 호환 서버는 usage 에 토큰 사용량을 담아 보냄
+                            x_groq = getattr(chunk, "x_groq", None)
+                            if x_groq is not None:
+                                _record_usage(self.timing, getattr(x_groq, "usage", None))
+                            _record_usage(self.timing, getattr(chunk, "usage", None))
+                            if not chunk.choices:
+                                continue
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                emitted = True
+                                self._emit(delta)
+                    finally:
+                        # 취소되면 연결을 닫아 남은 토큰 생성을 버림
+                        close = getattr(response, "close", None)
+                        if close is not None:
+                            close()
+                else:
+                    chat_completion = self.client.chat.completions.create(
+                        messages=self.messages,
+                        model=self.model,
+                        timeout=max(self._remaining(), 0.1),
+                    )
+                    _record_usage(self.timing, chat_completion.usage)
+                    self._emit(chat_completion.choices[0].message.content)
+                break
+            except Exception as e:
+                # 이미 일부 토큰을 보냈으면 중복 출력이 되므로 재시도하지 않음
+                if emitted or not _is_retryable(e) or attempt >= GROQ_MAX_RETRIES:
+                    self._emit(e)
+                    return
+                delay = _backoff_delay(attempt, e)
+                # 한도 초과면 다른 세션 요청도 같이 기다리도록 스케줄러 전체를 멈춤
+                if _is_rate_limited(e):
+                    _get_scheduler().pause(self.route, delay)
+                if delay >= self._remaining():
+                    self._emit(e)
+                    return
+                attempt += 1
+                self.timing["retries"] = attempt
+                self.cancelled.wait(delay)
+        self._emit(_DONE)
+
+    # 스크립트 스레드에서 토큰을 꺼내 넘겨주기 (중간에 멈추면 요청 취소)
+    def iter_tokens(self):
+        finished = False
+        try:
+            while True:
+                remaining = self._remaining()
+                if remaining <= 0:
+                    raise TimeoutError("LLM 응답 대기 시간이 초과되었습니다.")
+                try:
+                    item = self.tokens.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    finished = True
+                    break
+                if isinstance(item, BaseException):
+                    finished = True
+                    raise item
+                if "first_token" not in self.timing:
+                    self.timing["first_token"] = time.perf_counter() - self.submitted
+                yield item
+            self.timing["total"] = time.perf_counter() - self.submitted
+        finally:
+            if not finished:
+                self.cancel()
+
+
+# 이전 실행에서 끝나지 않은 요청이 남아 있으면 취소 (세션이 다른 화면으로 넘어간 경우)
+def cancel_pending_request(session):
+    request = session.get("llm_request")
+    if request is not None:
+        if not request.done():
+            request.cancel()
+        session["llm_request"] = None
+
+
+def _submit(client, messages, stream, session, model, route, priority):
+    owner = session.get("session_id") if session is not None else None
+    request = LLMRequest(client, messages, stream, model=model, route=route, priority=priority, owner=owner)
+    if session is not None:
+        cancel_pending_request(session)
+        session["llm_request"] = request
+    return request
+
+
+# 한 번에 전체 응답을 받아오기
+def complete_chat(client, messages, timing, session=None, model=MODEL_NAME, route="main",
+                  priority=PRIORITY_INTERACTIVE):
+    request = _submit(client, messages, False, session, model, route, priority)
+    try:
+        return "".join(request.iter_tokens())
+    finally:
+        timing.update(request.timing)
+
+
+# 스트리밍 응답을 토큰 단위로 넘겨주고 첫 토큰/전체 지연시간을 timing 에 기록
+def stream_chat(client, messages, timing, session=None, model=MODEL_NAME, route="main",
+                priority=PRIORITY_INTERACTIVE):
+    request = _submit(client, messages, True, session, model, route, priority)
+    try:
+        yield from request.iter_tokens()
+    finally:
+        timing.update(request.timing)
+
+
+# 결과를 화면에 바로 보여주지 않는 선행 요청, 응답이 끝까지 오면 워커 스레드에서 on_complete(text) 호출
+# 끝나면 (성공/실패/취소 모두) request.finished 가 설정됨
+def prefetch_chat(client, messages, on_complete, model=MODEL_NAME, route="main", owner=None):
+    request = LLMRequest(
+        client, messages, False, model=model, route=route, priority=PRIORITY_BACKGROUND, owner=owner
+    )
+    request.finished = threading.Event()
+
+    def finished(future):
+        try:
+            items = []
+            while not request.tokens.empty():
+                items.append(request.tokens.get_nowait())
+            if len(items) > 1 and items[-1] is _DONE and not any(isinstance(i, BaseException) for i in items):
+                on_complete("".join(items[:-1]))
+        finally:
+            request.finished.set()
+
+    request.future.add_done_callback(finished)
+    return request
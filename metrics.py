@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+
+# 메트릭 설정 (환경 변수로 조정)
+# METRICS_PATH 확장자가 .json 이면 JSON, 그 외에는 Prometheus 텍스트 형식으로 기록
+# 경로의 {pid} 는 프로세스 ID 로 바뀜 (기본값은 프로세스별 파일, 서버 프로세스를 여러 개 띄워도 서로 덮어쓰지 않음)
+METRICS_PATH = os.getenv("METRICS_PATH", os.path.join(".cache", "metrics-{pid}.prom"))
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "10"))
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))  # 0 이면 HTTP 엔드포인트를 띄우지 않음
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Prometheus HELP 문구
+DESCRIPTIONS = {
+    "app_page_seconds": "Streamlit 페이지 한 번 실행에 걸린 시간",
+    "app_llm_seconds": "Groq 요청 단계별 시간 (queue_wait, first_token, total)",
+    "app_llm_tokens_total": "Groq API 가 보고한 토큰 수",
+    "app_response_cache_requests_total": "응답 캐시 조회 결과",
+    "app_response_cache_hit_ratio": "응답 캐시 적중률 (프로세스 시작 이후)",
+    "app_pdf_build_seconds": "PDF 보고서 생성 시간",
+    "app_prefetch_total": "초기 검토 선행 요청 (started, used, failed)",
+    "app_errors_total": "단계별 오류 수 (stage 는 llm 또는 오류가 난 페이지)",
+}
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = [*key, *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+# 프로세스 안의 카운터/게이지/히스토그램 (스레드 안전, 기록 한 번은 잠금 + 사전 조회 정도의 비용)
+class Metrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}  # (이름, 라벨) -> [구간별 개수..., +Inf 개수, 합계]
+        self._lock = threading.Lock()
+        self._last_flush = time.time()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            histogram[index] += 1
+            histogram[-1] += value
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {key: list(value) for key, value in self._histograms.items()}
+        return counters, gauges, histograms
+
+    def to_json(self):
+        counters, gauges, histograms = self.snapshot()
+        result = {"timestamp": time.time(), "counters": [], "gauges": [], "histograms": []}
+        for (name, labels), value in sorted(counters.items()):
+            result["counters"].append({"name": name, "labels": dict(labels), "value": value})
+        for (name, labels), value in sorted(gauges.items()):
+            result["gauges"].append({"name": name, "labels": dict(labels), "value": value})
+        for (name, labels), histogram in sorted(histograms.items()):
+            count = sum(histogram[:-1])
+            result["histograms"].append({
+                "name": name,
+                "labels": dict(labels),
+                "count": count,
+                "sum": histogram[-1],
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], histogram[:-1])),
+            })
+        return json.dumps(result, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        counters, gauges, histograms = self.snapshot()
+        lines = []
+        described = set()
+
+        def header(name, kind):
+            if name not in described:
+                described.add(name)
+                if name in DESCRIPTIONS:
+                    lines.append(f"# HELP {name} {DESCRIPTIONS[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), value in sorted(gauges.items()):
+            header(name, "gauge")
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(histograms.items()):
+            header(name, "histogram")
+            cumulative = 0
+            for bound, count in zip([*map(str, self.buckets), "+Inf"], histogram[:-1]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram[-1]}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    # 파일에 원자적으로 기록 (같은 디렉터리의 고유한 임시 파일에 쓴 뒤 교체)
+    # 여러 프로세스가 같은 경로에 써도 임시 파일이 겹치지 않고, 마지막으로 교체한 내용이 남음
+    def flush(self, path=METRICS_PATH):
+        path = path.format(pid=os.getpid())
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        content = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=directory or ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    # 실행마다 호출, METRICS_FLUSH_SECONDS 가 지났을 때만 파일을 다시 씀
+    def maybe_flush(self, path=METRICS_PATH):
+        now = time.time()
+        with self._lock:
+            if now - self._last_flush < METRICS_FLUSH_SECONDS:
+                return
+            self._last_flush = now
+        # 페이지 실행의 finally 에서 불리므로 파일 기록 실패가 화면 오류가 되지 않도록 로그만 남김
+        try:
+            self.flush(path)
+        except OSError:
+            logger.exception("metrics flush to %s failed", path)
+
+
+def _serve(metrics, port):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] == "/metrics.json":
+                body, content_type = metrics.to_json(), "application/json"
+            elif self.path.split("?")[0] == "/metrics":
+                body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+    return server
+
+
+# 서버 프로세스당 하나의 메트릭 저장소 (METRICS_PORT 를 지정하면 /metrics, /metrics.json 도 제공)
+@st.cache_resource(show_spinner=False)
+def get_metrics():
+    metrics = Metrics()
+    if METRICS_PORT:
+        # 같은 포트를 다른 서버 프로세스가 이미 쓰고 있으면 엔드포인트 없이 계속 (파일 기록은 그대로)
+        try:
+            _serve(metrics, METRICS_PORT)
+        except OSError:
+            logger.exception("metrics endpoint on port %d not started", METRICS_PORT)
+    return metrics
@@ -0,0 +1,143 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# 시뮬레이션 설정 (환경 변수로 조정)
+PRICE_HISTORY_DIR = os.getenv("PRICE_HISTORY_DIR", os.path.join("data", "prices"))
+MC_PATHS = int(os.getenv("MC_PATHS", "100000"))
+MC_STEPS = int(os.getenv("MC_STEPS", "252"))  # 1년 거래일
+MC_CHUNK = int(os.getenv("MC_CHUNK", "8192"))  # 한 번에 메모리에 올리는 경로 수
+MC_SEED = int(os.getenv("MC_SEED", "42"))
+MC_PROCESSES = int(os.getenv("MC_PROCESSES", "1"))
+
+# 가격 이력이 없을 때 쓰는 기본 가정 (연 기대수익률, 연 변동성)
+DEFAULT_ANNUAL_RETURN = 0.07
+DEFAULT_ANNUAL_VOLATILITY = 0.25
+
+PERCENTILES = [5, 25, 50, 75, 95]
+BAND_POINTS = 13  # 밴드를 기록하는 시점 수 (시작 + 월별)
+
+
+def _history_path(stock_name, history_dir=PRICE_HISTORY_DIR):
+    file_name = re.sub(r"[^\w.-]", "_", stock_name.strip())
+    path = os.path.join(history_dir, f"{file_name}.csv")
+    return path if file_name and os.path.exists(path) else None
+
+
+# PRICE_HISTORY_DIR/<종목 이름>.csv 에서 종가를 읽어 일별 로그수익률로 변환 (없으면 None)
+def load_log_returns(stock_name, history_dir=PRICE_HISTORY_DIR):
+    path = _history_path(stock_name, history_dir)
+    if path is None:
+        return None
+    prices = pd.read_csv(path)
+    column = next((c for c in ("Close", "close", "종가") if c in prices.columns), None)
+    if column is None:
+        column = prices.select_dtypes("number").columns[-1]
+    closes = prices[column].dropna().to_numpy(dtype=float)
+    closes = closes[closes > 0]
+    if len(closes) < 2:
+        return None
+    return np.diff(np.log(closes))
+
+
+# 청크 하나의 경로를 만들어 밴드 시점의 가격 배율만 돌려줌 (n, BAND_POINTS)
+def _simulate_chunk(seed, n_paths, steps, checkpoints, method, drift, volatility, returns):
+    rng = np.random.default_rng(seed)
+    if method == "bootstrap":
+        log_steps = returns[rng.integers(0, len(returns), size=(n_paths, steps))]
+    else:
+        log_steps = rng.standard_normal((n_paths, steps))
+        log_steps *= volatility
+        log_steps += drift
+    np.cumsum(log_steps, axis=1, out=log_steps)
+    multiples = np.exp(log_steps[:, checkpoints - 1])
+    multiples[:, checkpoints == 0] = 1.0
+    return multiples
+
+
+def _simulate_chunk_args(args):
+    return _simulate_chunk(*args)
+
+
+# GBM 또는 과거 수익률 부트스트랩으로 경로를 청크 단위로 시뮬레이션
+# 청크마다 SeedSequence 에서 나온 시드를 쓰므로 프로세스 수와 관계없이 결과가 같음
+def simulate(initial_value, returns=None, method="gbm", n_paths=MC_PATHS, steps=MC_STEPS,
+             chunk_size=MC_CHUNK, seed=MC_SEED, processes=MC_PROCESSES):
+    if returns is not None and len(returns) >= 2:
+        drift, volatility = float(np.mean(returns)), float(np.std(returns, ddof=1))
+    else:
+        method = "gbm"
+        volatility = DEFAULT_ANNUAL_VOLATILITY / np.sqrt(MC_STEPS)
+        drift = np.log1p(DEFAULT_ANNUAL_RETURN) / MC_STEPS
+
+    checkpoints = np.unique(np.linspace(0, steps, BAND_POINTS).round().astype(int))
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(s, n, steps, checkpoints, method, drift, volatility, returns) for s, n in zip(seeds, sizes)]
+
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunks = list(pool.map(_simulate_chunk_args, jobs))
+    else:
+        chunks = [_simulate_chunk(*job) for job in jobs]
+
+    values = np.concatenate(chunks) * initial_value
+    bands = np.percentile(values, PERCENTILES, axis=0).T
+    terminal = values[:, -1]
+
+    # 손실 = 초기 평가액 - 만기 평가액, VaR 는 95% 분위 손실, CVaR 는 그보다 큰 손실의 평균
+    losses = initial_value - terminal
+    var_95 = float(np.percentile(losses, 95))
+    cvar_95 = float(losses[losses >= var_95].mean())
+    return {
+        "method": method,
+        "steps": checkpoints,
+        "bands": bands,
+        "percentiles": dict(zip(PERCENTILES, bands[-1])),
+        "var_95": var_95,
+        "cvar_95": cvar_95,
+    }
+
+
+# 평가액 1 기준 시뮬레이션 결과를 종목별로 재사용 (결과는 평가액에 비례하므로 보유 수량과 무관)
+@lru_cache(maxsize=256)
+def _unit_simulation(stock_name, history_mtime, seed):
+    returns = load_log_returns(stock_name)
+    method = "bootstrap" if returns is not None else "gbm"
+    result = simulate(1.0, returns, method=method, seed=seed)
+    result["history"] = returns is not None
+    return result
+
+
+# 보고서/PDF 에 쓰는 투자 관리 항목 시뮬레이션
+def investment_simulation(stock_name, shares, price_per_share, seed=MC_SEED):
+    path = _history_path(stock_name)
+    unit = _unit_simulation(stock_name.strip(), os.path.getmtime(path) if path else None, seed)
+    initial_value = shares * price_per_share
+    return {
+        "method": unit["method"],
+        "history": unit["history"],
+        "steps": unit["steps"],
+        "bands": unit["bands"] * initial_value,
+        "percentiles": {p: v * initial_value for p, v in unit["percentiles"].items()},
+        "var_95": unit["var_95"] * initial_value,
+        "cvar_95": unit["cvar_95"] * initial_value,
+        "initial_value": initial_value,
+    }
+
+
+def investment_summary(data):
+    result = investment_simulation(data["종목 이름"], data["보유 주식 수"], data["주당 가격"])
+    percentiles = result["percentiles"]
+    return {
+        "현재 평가액": round(result["initial_value"]),
+        "1년 후 하위 5%": round(percentiles[5]),
+        "1년 후 중앙값": round(percentiles[50]),
+        "1년 후 상위 5%": round(percentiles[95]),
+        "VaR 95%": round(result["var_95"]),
+        "CVaR 95%": round(result["cvar_95"]),
+    }
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+
+from fontTools import subset as ftsubset
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+
+from pension import pension_summary, pension_sensitivity
+from tax import tax_summary
+from monte_carlo import investment_summary
+
+logger = logging.getLogger(__name__)
+
+FONT_FAMILY = "NotoSans"
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font")
+# 서브셋 폰트 파일을 저장해 두는 위치 (여러 서버 프로세스가 같이 사용)
+FONT_CACHE_DIR = os.getenv("REPORT_FONT_CACHE_DIR", os.path.join(".cache", "fonts"))
+
+# REPORT_FONT_PATH 가 없을 때 차례로 찾아보는 폰트 (한글 글리프가 있는 폰트를 우선 사용)
+FONT_CANDIDATES = [
+    os.path.join(FONT_DIR, "NotoSansCJKkr-Medium.otf"),
+    os.path.join(FONT_DIR, "NotoSansKR-Regular.ttf"),
+    os.path.join(FONT_DIR, "NanumGothic.ttf"),
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Medium.ttc",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "C:/Windows/Fonts/malgun.ttf",
+    os.path.join(FONT_DIR, "NotoSans-Italic-VariableFont_wdth,wght.ttf"),
+]
+
+# 보고서에 쓰이는 문자 범위 (라틴, 문장부호, 한글 자모/음절, 전각 기호)
+REPORT_UNICODE_RANGES = [
+    (0x0020, 0x007E), (0x00A0, 0x00FF), (0x2000, 0x206F), (0x20A9, 0x20A9),
+    (0x2190, 0x21FF), (0x2460, 0x24FF), (0x25A0, 0x25FF), (0x3000, 0x303F),
+    (0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7A3), (0xFF00, 0xFFEF),
+]
+
+
+# user_data + chat_history 내용으로 만든 해시 (내용이 같으면 PDF 를 다시 만들지 않음)
+def report_digest(user_data, chat_history):
+    raw = json.dumps([user_data, chat_history], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _has_hangul(path):
+    try:
+        font = ttLib.TTFont(path, fontNumber=0, lazy=True)
+        return 0xAC00 in (font.getBestCmap() or {})
+    except Exception:
+        return False
+
+
+# 보고서 폰트 찾기 (프로세스당 한 번)
+@lru_cache(maxsize=None)
+def find_report_font():
+    configured = os.getenv("REPORT_FONT_PATH")
+    if configured:
+        if not os.path.exists(configured):
+            raise FileNotFoundError(f"REPORT_FONT_PATH 폰트 파일을 찾을 수 없습니다: {configured}")
+        return configured
+    existing = [path for path in FONT_CANDIDATES if os.path.exists(path)]
+    for path in existing:
+        if _has_hangul(path):
+            return path
+    if existing:
+        return existing[0]
+    raise FileNotFoundError("보고서용 폰트를 찾을 수 없습니다. REPORT_FONT_PATH 를 설정하세요.")
+
+
+# 서버 시작 시 폰트 상태 확인, 문제가 있으면 경고 메시지를 돌려줌
+def check_report_font():
+    try:
+        path = find_report_font()
+    except FileNotFoundError as e:
+        return str(e)
+    if not _has_hangul(path):
+        return f"보고서 폰트에 한글 글리프가 없습니다: {path} (REPORT_FONT_PATH 로 한글 폰트를 지정하세요)"
+    return None
+
+
+# 보고서에 필요한 문자만 남긴 서브셋 폰트를 만들어 캐시 디렉터리에 저장 (프로세스당 한 번)
+@lru_cache(maxsize=None)
+def _subset_font_path():
+    source = find_report_font()
+    stat = os.stat(source)
+    key = hashlib.sha256(f"{os.path.abspath(source)}:{stat.st_size}:{stat.st_mtime}:{REPORT_UNICODE_RANGES}".encode()).hexdigest()[:16]
+    font = ttLib.TTFont(source, fontNumber=0, recalcTimestamp=False)
+    ext = ".otf" if "CFF " in font or "CFF2" in font else ".ttf"
+    path = os.path.join(FONT_CACHE_DIR, f"report-font-{key}{ext}")
+    if os.path.exists(path):
+        return path
+
+    options = ftsubset.Options()
+    options.notdef_outline = True
+    options.recommended_glyphs = True
+    options.layout_features = []
+    # fpdf2 가 쓰지 않는 테이블은 빼서 문서마다 하는 파싱/서브셋 비용을 줄임
+    options.drop_tables += ["kern", "GSUB", "GPOS", "GDEF", "hdmx", "TSI0", "TSI1", "TSI2", "TSI3", "TSI5"]
+    subsetter = ftsubset.Subsetter(options)
+    subsetter.populate(unicodes=[c for start, end in REPORT_UNICODE_RANGES for c in range(start, end + 1)])
+    subsetter.subset(font)
+
+    os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    font.save(tmp_path)
+    os.replace(tmp_path, path)
+    logger.info("report font subset written to %s", path)
+    return path
+
+
+# 폰트 서브셋을 미리 만들어 두기 (서버 시작 또는 배치 워커 프로세스 시작 시)
+def warm_report_font():
+    _subset_font_path()
+
+
+# 서브셋 폰트를 새 FPDF 문서에 등록 (서브셋 파일이 작아서 문서마다 파싱해도 빠름)
+def add_report_font(pdf):
+    pdf.add_font(FONT_FAMILY, "", _subset_font_path())
+
+
+# write_html 을 쓰는 문서용: 굵게/기울임/제목 태그도 같은 폰트로 표시 (보고서 폰트에는 굵은 글꼴이 따로 없음)
+def add_report_font_styles(pdf):
+    path = _subset_font_path()
+    for style in ("B", "I", "BI"):
+        pdf.add_font(FONT_FAMILY, style, path)
+
+
+# 연금 적립금 예측과 이자율 × 기간 민감도
+def add_pension_projection(pdf, data):
+    for key, value in pension_summary(data).items():
+        pdf.cell(200, 10, text=f"{key}: {value:,} 만원", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+    rates, years, grid = pension_sensitivity(data)
+    pdf.cell(200, 10, text="민감도 (이자율 / " + " · ".join(f"{year}년" for year in years) + ")",
+             new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+    for rate, row in zip(rates, grid):
+        pdf.cell(200, 10, text=f"  {rate:.1f}%: " + " · ".join(f"{value:,.0f}" for value in row),
+                 new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+
+
+# 최종 보고서 PDF 를 파일에 쓰지 않고 메모리에서 bytes 로 생성
+def build_report_pdf(user_data, chat_history):
+    pdf = FPDF()
+    pdf.add_page()
+
+    # 유니코드 폰트 추가 (프로세스 캐시에서 가져옴)
+    add_report_font(pdf)
+    pdf.set_font(FONT_FAMILY, size=12)
+
+    # 제목 추가
+    pdf.cell(200, 10, text="최종 보고서", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+    pdf.ln(10)
+
+    # 사용자 데이터 추가
+    for section, data in user_data.items():
+        pdf.cell(200, 10, text=section, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        for key, value in data.items():
+            pdf.cell(200, 10, text=f"{key}: {value}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        if section == "세금 관리":
+            for key, value in tax_summary(data).items():
+                text = f"{key}: {value:,} 만원" if isinstance(value, int) else f"{key}: {value}"
+                pdf.cell(200, 10, text=text, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        elif section == "투자 관리":
+            for key, value in investment_summary(data).items():
+                pdf.cell(200, 10, text=f"{key}: {value:,} 만원", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        elif section == "연금 관리":
+            add_pension_projection(pdf, data)
+        pdf.ln(5)
+
+    # GPT 상담 내용 추가
+    pdf.ln(10)
+    pdf.cell(200, 10, text="GPT 상담 내용", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+    for chat in chat_history:
+        if chat["role"] == "user":
+            pdf.cell(200, 10, text=f"사용자: {chat['content']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        else:
+            pdf.cell(200, 10, text=f"GPT: {chat['content']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+
+    return bytes(pdf.output())
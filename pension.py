@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def _monthly_rate(annual_rate):
+    return np.asarray(annual_rate, dtype=float) / 100 / 12
+
+
+# (1+r)^n - 1) / r 를 r=0 일 때도 안전하게 계산 (r=0 이면 n)
+def _annuity_factor(rate, months):
+    rate, months = np.broadcast_arrays(np.asarray(rate, dtype=float), np.asarray(months, dtype=float))
+    factor = np.array(months, dtype=float)
+    nonzero = rate != 0
+    factor[nonzero] = np.expm1(months[nonzero] * np.log1p(rate[nonzero])) / rate[nonzero]
+    return factor
+
+
+# 매월 말 납입, 월 복리 기준 만기 적립금 (입력은 스칼라 또는 배열, 브로드캐스팅 지원)
+def future_value(monthly_contribution, years, annual_rate):
+    months = np.asarray(years, dtype=float) * 12
+    return np.asarray(monthly_contribution, dtype=float) * _annuity_factor(_monthly_rate(annual_rate), months)
+
+
+# 월별 적립금 경로, 마지막 축이 0..최대 개월 수 (납입 기간이 끝난 뒤는 NaN)
+def balance_paths(monthly_contribution, years, annual_rate):
+    monthly_contribution = np.asarray(monthly_contribution, dtype=float)
+    months = np.asarray(years, dtype=float) * 12
+    steps = np.arange(int(months.max()) + 1 if months.size else 1)
+    # 성장 계수는 이자율 × 개월 수에만 의존하므로 브로드캐스팅 전 모양 그대로 계산
+    factor = _annuity_factor(_monthly_rate(annual_rate)[..., None], steps)
+    paths = monthly_contribution[..., None] * factor
+    return np.where(steps <= months[..., None], paths, np.nan)
+
+
+# 이자율 × 기간 × 월 납입액 조합 전체의 만기 적립금을 한 번에 계산 (shape: rates, years, contributions)
+def sensitivity_grid(annual_rates, years, monthly_contributions):
+    rate, year, contribution = np.ix_(
+        np.asarray(annual_rates, dtype=float),
+        np.asarray(years, dtype=float),
+        np.asarray(monthly_contributions, dtype=float),
+    )
+    return future_value(contribution, year, rate)
+
+
+# 보고서/PDF 에 쓰는 연금 항목 요약 (단위: 만원)
+def pension_summary(data):
+    monthly = data["월 납입액"]
+    years = data["납입 기간"]
+    rate = data["연 이자율"]
+    total = float(future_value(monthly, years, rate))
+    contributed = monthly * years * 12
+    return {
+        "예상 적립금": round(total),
+        "총 납입액": round(contributed),
+        "이자 수익": round(total - contributed),
+    }
+
+
+# 보고서에 보여줄 연 이자율 ±1%p × 납입 기간 ±5년 민감도 표 (행: 이자율, 열: 기간)
+def pension_sensitivity(data):
+    rates = np.clip(data["연 이자율"] + np.array([-1.0, 0.0, 1.0]), 0, None)
+    years = np.clip(data["납입 기간"] + np.array([-5, 0, 5]), 0, None)
+    grid = sensitivity_grid(rates, years, [data["월 납입액"]])[..., 0]
+    return rates, years, np.round(grid)
@@ -0,0 +1,350 @@
+import os
+import threading
+
+import streamlit as st
+
+from research_data import load_frame, table_version
+
+# 그림을 처음 그린 뒤 나머지 섹션의 그림을 백그라운드에서 미리 만들어 둠 (0 이면 끔)
+RESEARCH_WARMUP = os.getenv("RESEARCH_WARMUP", "1") == "1"
+
+# 보고서 섹션: (페이지 모듈, 제목, URL 경로)
+# 앱 목차(fintech-research.py)와 정적 내보내기(export_research.py)가 같이 사용
+SECTIONS = [
+    ("research_pages/intro.py", "1. 서론: 핀테크 발전사", "intro"),
+    ("research_pages/market.py", "2. 시장 현황 및 트렌드", "market"),
+    ("research_pages/companies.py", "3. 주요 기업 분석", "companies"),
+    ("research_pages/technology.py", "4. 기술 혁신과 규제 환경", "technology"),
+    ("research_pages/outlook.py", "5. 향후 전망 및 리스크", "outlook"),
+    ("research_pages/conclusion.py", "6. 결론 및 참고문헌", "conclusion"),
+]
+
+# 기본 스타일 (모든 페이지 공통)
+PAGE_STYLE = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        margin-bottom: 1.5rem;
+    }
+    .section-header {
+        font-size: 1.8rem;
+        font-weight: bold;
+        margin-top: 2rem;
+        margin-bottom: 1rem;
+        color: #1E3A8A;
+    }
+    .subsection-header {
+        font-size: 1.4rem;
+        font-weight: bold;
+        margin-top: 1.5rem;
+        margin-bottom: 0.8rem;
+        color: #2563EB;
+    }
+    .caption {
+        font-size: 0.8rem;
+        font-style: italic;
+        color: #6B7280;
+    }
+    .highlight {
+        background-color: #FEF3C7;
+        padding: 0.2rem;
+        border-radius: 0.2rem;
+    }
+    .insight-box {
+        background-color: #E0F2FE;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+    }
+    .table-wrapper {
+        margin: 1.5rem 0;
+    }
+</style>
+"""
+
+
+# 리서치 그림 캐시
+# 데이터는 research_data 가 data/research/*.feather 에서 필요한 표만 읽고,
+# 완성된 그림은 (그림 이름, 사용하는 표의 파일 버전, 파라미터)별로 한 번만 만든다 (st.cache_resource)
+# 분석가가 표 파일을 바꾸면 파일 버전이 달라져 해당 그림만 새로 만들어짐
+
+
+def timeline_figure(data):
+    import plotly.express as px
+
+    fig = px.bar(data["timeline"], x='Year', y='Impact',
+                 color='Event', hover_data=['Description'],
+                 labels={'Impact': '영향력 지수', 'Year': '연도'},
+                 title="핀테크 산업 발전 타임라인 (1998-2025)")
+    fig.update_layout(height=400)
+    return fig
+
+
+def market_figure(data):
+    import plotly.graph_objects as go
+
+    market_data = data["market"]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=market_data['Year'],
+        y=market_data['Market_Size'],
+        name='시장 규모(조 원)',
+        marker_color='rgb(55, 83, 109)'
+    ))
+    fig.add_trace(go.Scatter(
+        x=market_data['Year'],
+        y=market_data['Growth_Rate'],
+        name='성장률(%)',
+        mode='lines+markers',
+        yaxis='y2',
+        line=dict(color='rgb(220, 96, 96)', width=3),
+        marker=dict(size=8)
+    ))
+    fig.update_layout(
+        title='핀테크 글로벌 시장 규모 및 성장률 (2020-2027)',
+        xaxis=dict(title='연도'),
+        yaxis=dict(title='시장 규모(조 원)', side='left', showgrid=True),
+        yaxis2=dict(title='성장률(%)', side='right', overlaying='y', showgrid=False),
+        legend=dict(x=0.01, y=0.99, bgcolor='rgba(255, 255, 255, 0.5)'),
+        height=500
+    )
+    return fig
+
+
+def trend_figure(data):
+    import plotly.express as px
+
+    trends = data["trends"]
+    fig = px.scatter(
+        x=trends['maturity'], y=trends['impact'], text=trends['trend'],
+        size=[50]*len(trends), color=trends['trend'],
+        labels={'x': '시장 성숙도', 'y': '영향력'},
+        title='2025년 핀테크 핵심 트렌드 맵',
+        height=500
+    )
+    fig.update_traces(textposition='top center')
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+# 기업 비교 막대 차트 (metric: MAU, transactions, partners)
+COMPANY_METRICS = {
+    'MAU': ('월간 활성 사용자 수 (MAU, 만 명)', 'MAU (만 명)', 400),
+    'transactions': ('연간 거래액 (조 원)', '거래액 (조 원)', 350),
+    'partners': ('제휴사 수', '제휴사 수', 350),
+}
+
+
+def company_figure(data, metric):
+    import plotly.express as px
+
+    title, label, height = COMPANY_METRICS[metric]
+    return px.bar(
+        data["company"],
+        x='company',
+        y=metric,
+        color='company',
+        title=title,
+        labels={'company': '기업', metric: label},
+        height=height
+    )
+
+
+def investment_figure(data):
+    import plotly.graph_objects as go
+
+    investment_data = data["investment"]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=investment_data['Quarter'],
+        y=investment_data['Investment'],
+        name='투자액(십억$)',
+        marker_color='rgb(26, 118, 255)'
+    ))
+    fig.add_trace(go.Scatter(
+        x=investment_data['Quarter'],
+        y=investment_data['Deals'],
+        name='거래 건수',
+        mode='lines+markers',
+        yaxis='y2',
+        line=dict(color='rgb(219, 64, 82)', width=3),
+        marker=dict(size=8)
+    ))
+    fig.update_layout(
+        title='글로벌 핀테크 투자 및 거래 건수 (2023-2025)',
+        xaxis=dict(title='분기'),
+        yaxis=dict(title='투자액(십억$)', side='left'),
+        yaxis2=dict(title='거래 건수', side='right', overlaying='y'),
+        legend=dict(x=0.01, y=0.99),
+        height=400
+    )
+    return fig
+
+
+def tech_figure(data):
+    import plotly.express as px
+
+    tech_data = data["tech"]
+    fig = px.scatter(
+        tech_data,
+        x='도입률(%)',
+        y='예상성장률(%)',
+        size=[50]*len(tech_data),
+        color='기술',
+        text='기술',
+        labels={'도입률(%)': '현재 도입률(%)', '예상성장률(%)': '향후 3년 예상 성장률(%)'},
+        title='핀테크 핵심 기술 성장 매트릭스 (2025년 기준)'
+    )
+    fig.update_traces(textposition='top center')
+    fig.update_layout(height=450)
+    return fig
+
+
+def regulation_figure(data):
+    import plotly.express as px
+
+    fig = px.line(
+        data["regulation"],
+        x='Year',
+        y='Impact',
+        text='Event',
+        markers=True,
+        labels={'Year': '연도', 'Impact': '산업 영향도', 'Event': '주요 규제 변화'},
+        title='핀테크 규제 환경 변화 타임라인 (2020-2025)'
+    )
+    fig.update_traces(textposition='top center')
+    fig.update_layout(height=400)
+    return fig
+
+
+# 시나리오별 선 (컬럼, 이름, 색)
+SCENARIOS = [
+    ('Optimistic', '긍정적 시나리오', 'rgb(0, 176, 80)'),
+    ('Base', '중립적 시나리오', 'rgb(255, 192, 0)'),
+    ('Pessimistic', '부정적 시나리오', 'rgb(192, 0, 0)'),
+]
+
+
+def scenario_figure(data):
+    import plotly.graph_objects as go
+
+    scenario_data = data["scenario"]
+    fig = go.Figure()
+    for column, name, color in SCENARIOS:
+        fig.add_trace(go.Scatter(
+            x=scenario_data['Year'],
+            y=scenario_data[column],
+            name=name,
+            mode='lines+markers',
+            line=dict(color=color, width=3),
+            marker=dict(size=8)
+        ))
+    fig.update_layout(
+        title='핀테크 글로벌 시장 시나리오별 전망 (2025-2027)',
+        xaxis=dict(title='연도'),
+        yaxis=dict(title='시장 규모(조 원)'),
+        legend=dict(x=0.01, y=0.99),
+        height=450
+    )
+    return fig
+
+
+def risk_figure(data, sort_by='위험도(1-10)'):
+    import plotly.express as px
+
+    fig = px.bar(
+        data["risk"].sort_values(by=sort_by, ascending=False),
+        x='위험요소',
+        y='위험도(1-10)',
+        color='증가율(%)',
+        color_continuous_scale='Reds',
+        text='증가율(%)',
+        labels={'위험요소': '주요 리스크', '위험도(1-10)': '위험도 점수'},
+        title='핀테크 산업 주요 리스크 요인 및 증가율 (2025년)'
+    )
+    fig.update_traces(texttemplate='%{text}%', textposition='outside')
+    fig.update_layout(height=450)
+    return fig
+
+
+def recommendation_figure(data):
+    import plotly.express as px
+
+    rec_data = data["recommendation"]
+    fig = px.scatter(
+        rec_data,
+        x='중요도',
+        y='시급성',
+        text='제언',
+        size=[50]*len(rec_data),
+        color='제언',
+        labels={'중요도': '중요도(100점 만점)', '시급성': '시급성(100점 만점)'},
+        title='핀테크 산업 발전을 위한 5대 제언 매트릭스'
+    )
+    fig.update_traces(textposition='top center')
+    fig.update_layout(height=450)
+    return fig
+
+
+# 그림 이름 -> (만드는 함수, 사용하는 표)
+FIGURES = {
+    "timeline": (timeline_figure, ("timeline",)),
+    "market": (market_figure, ("market",)),
+    "trends": (trend_figure, ("trends",)),
+    "company": (company_figure, ("company",)),
+    "investment": (investment_figure, ("investment",)),
+    "tech": (tech_figure, ("tech",)),
+    "regulation": (regulation_figure, ("regulation",)),
+    "scenario": (scenario_figure, ("scenario",)),
+    "risk": (risk_figure, ("risk",)),
+    "recommendation": (recommendation_figure, ("recommendation",)),
+}
+
+
+# 완성된 그림은 모든 세션이 같이 씀 (읽기 전용으로만 사용할 것)
+# 표 파일이 바뀌면 versions 가 달라져 새 항목으로 만들어지고, 예전 항목은 max_entries 를 넘으면 밀려남
+@st.cache_resource(show_spinner=False, max_entries=64)
+def get_figure(name, versions, **params):
+    builder, tables = FIGURES[name]
+    return builder({table: load_frame(table) for table in tables}, **params)
+
+
+def figure_versions(name):
+    return tuple(table_version(table) for table in FIGURES[name][1])
+
+
+def show_figure(name, **params):
+    st.plotly_chart(get_figure(name, figure_versions(name), **params), use_container_width=True)
+
+
+# 섹션 순서대로 그리는 그림 (워밍업 대상)
+WARMUP_FIGURES = [
+    ("timeline", {}),
+    ("market", {}),
+    ("trends", {}),
+    *(("company", {"metric": metric}) for metric in COMPANY_METRICS),
+    ("investment", {}),
+    ("tech", {}),
+    ("regulation", {}),
+    ("scenario", {}),
+    ("risk", {}),
+    ("recommendation", {}),
+]
+
+
+def _warm_up():
+    for name, params in WARMUP_FIGURES:
+        try:
+            get_figure(name, figure_versions(name), **params)
+        except Exception:
+            # 워밍업 실패는 무시 (해당 섹션을 열 때 다시 만들면서 오류가 화면에 보임)
+            pass
+
+
+# 프로세스당 한 번, 첫 화면을 보낸 뒤에 시작 (첫 화면과 CPU 를 다투지 않도록)
+@st.cache_resource(show_spinner=False)
+def start_warmup():
+    thread = threading.Thread(target=_warm_up, daemon=True, name="research-warmup")
+    thread.start()
+    return thread
@@ -0,0 +1,127 @@
+import argparse
+import hashlib
+import os
+
+import streamlit as st
+
+# 리서치 보고서 데이터 (표마다 Feather 파일 하나)
+# 분석가는 코드 수정 없이 `python research_data.py import <표> <CSV>` 로 파일만 바꾸면 됨
+RESEARCH_DATA_DIR = os.getenv("RESEARCH_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "research"))
+
+# 표별 스키마 (열 순서와 타입까지 맞아야 함, 타입은 pyarrow 타입 이름)
+SCHEMAS = {
+    "market": [("Year", "int64"), ("Market_Size", "int64"), ("Growth_Rate", "float64")],
+    "timeline": [("Year", "int64"), ("Event", "string"), ("Impact", "int64"), ("Description", "string")],
+    "market_table": [("구분", "string"), ("2023", "float64"), ("2024", "float64"), ("2025", "float64")],
+    "trends": [("trend", "string"), ("impact", "int64"), ("maturity", "int64")],
+    "company": [("company", "string"), ("MAU", "int64"), ("transactions", "int64"), ("partners", "int64")],
+    "investment": [("Quarter", "string"), ("Investment", "float64"), ("Deals", "int64")],
+    "tech": [("기술", "string"), ("도입률(%)", "int64"), ("예상성장률(%)", "int64")],
+    "tech_table": [("기술", "string"), ("도입률(%)", "int64"), ("주요 응용 분야", "string")],
+    "regulation": [("Year", "int64"), ("Event", "string"), ("Impact", "int64")],
+    "scenario": [("Year", "int64"), ("Optimistic", "int64"), ("Base", "int64"), ("Pessimistic", "int64")],
+    "risk": [("위험요소", "string"), ("위험도(1-10)", "float64"), ("증가율(%)", "int64")],
+    "recommendation": [("제언", "string"), ("중요도", "int64"), ("시급성", "int64")],
+}
+
+
+# pyarrow 는 표를 처음 읽을 때 import (페이지 첫 요소가 pyarrow/pandas import 를 기다리지 않도록)
+def arrow_schema(name):
+    import pyarrow as pa
+
+    return pa.schema([(column, pa.type_for_alias(type_name)) for column, type_name in SCHEMAS[name]])
+
+
+def table_path(name):
+    if name not in SCHEMAS:
+        raise ValueError(f"알 수 없는 리서치 데이터 표입니다: {name!r}")
+    return os.path.join(RESEARCH_DATA_DIR, f"{name}.feather")
+
+
+# 파일 내용을 읽지 않고 바뀌었는지만 알 수 있는 값 (캐시 키로 사용)
+def table_version(name):
+    stat = os.stat(table_path(name))
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+# 파일 내용 해시 (체크아웃/복사로 수정 시각이 바뀌어도 같은 데이터면 같은 값, 정적 내보내기에서 사용)
+def table_digest(name):
+    with open(table_path(name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def validate_table(name, table):
+    expected = arrow_schema(name)
+    if table.schema.names != expected.names:
+        raise ValueError(f"'{name}' 표의 열이 다릅니다: {table.schema.names} (기대값 {expected.names})")
+    for field in expected:
+        actual = table.schema.field(field.name).type
+        if actual != field.type:
+            raise ValueError(f"'{name}' 표의 '{field.name}' 열 타입이 다릅니다: {actual} (기대값 {field.type})")
+    return table
+
+
+# 압축하지 않은 Feather 파일을 메모리 매핑으로 읽음
+# 고정 길이 열은 복사 없이 페이지 캐시를 그대로 쓰므로 워커 프로세스가 여러 개여도 메모리가 한 벌만 듦
+# version 이 캐시 키에 들어가므로 파일이 바뀌면 다음 실행에서 새로 읽음
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _read_table(name, version):
+    import pyarrow.feather as feather
+
+    return validate_table(name, feather.read_table(table_path(name), memory_map=True))
+
+
+# 필요한 표만 그때그때 읽음 (섹션에서 쓰는 표만 열림)
+def load_table(name):
+    return _read_table(name, table_version(name))
+
+
+def load_frame(name):
+    return load_table(name).to_pandas()
+
+
+def write_table(name, frame):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    schema = arrow_schema(name)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    try:
+        table = table.select(schema.names).cast(schema)
+    except (KeyError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"'{name}' 표를 스키마에 맞출 수 없습니다: {e}")
+    validate_table(name, table)
+    os.makedirs(RESEARCH_DATA_DIR, exist_ok=True)
+    temp_path = f"{table_path(name)}.tmp"
+    # 메모리 매핑으로 바로 읽을 수 있도록 압축하지 않음
+    feather.write_feather(table, temp_path, compression="uncompressed")
+    os.replace(temp_path, table_path(name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리서치 보고서 데이터 표 확인/교체")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("check", help="모든 표의 스키마 확인")
+    importer = commands.add_parser("import", help="CSV 로 표 하나를 교체")
+    importer.add_argument("name", choices=list(SCHEMAS))
+    importer.add_argument("csv", help="UTF-8 CSV (첫 줄은 열 이름)")
+    exporter = commands.add_parser("export", help="표 하나를 CSV 로 저장 (수정용)")
+    exporter.add_argument("name", choices=list(SCHEMAS))
+    exporter.add_argument("csv")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        import pandas as pd
+
+        write_table(args.name, pd.read_csv(args.csv))
+        print(f"{table_path(args.name)} 갱신 완료")
+    elif args.command == "export":
+        load_frame(args.name).to_csv(args.csv, index=False)
+    else:
+        for name in SCHEMAS:
+            table = load_table(name)
+            print(f"{name}: {table.num_rows}행 OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import streamlit as st
+
+from research_common import show_figure
+
+# 3. 주요 기업 분석
+st.markdown('<p class="main-header">3. 주요 기업 및 기술 심층 분석</p>', unsafe_allow_html=True)
+
+# 국내 Top 3 플레이어 비교
+st.markdown('<p class="subsection-header">3.1 국내 Top 3 플레이어 비교</p>', unsafe_allow_html=True)
+
+st.write("""
+한국 핀테크 시장은 2021년 이후 빠른 성장을 보이며 2025년 현재 약 68조원 규모로 성장했습니다. 
+특히 3대 메이저 플레이어인 카카오페이, 네이버파이낸셜, 토스는 모바일 결제에서 시작해 종합 금융 플랫폼으로 
+사업영역을 확장하며 시장을 주도하고 있습니다.
+
+세 기업은 각자의 강점을 기반으로 차별화된 전략을 구사하며 경쟁하고 있습니다:
+
+- **카카오페이**: 3,200만 MAU를 보유한 카카오톡 기반의 강력한 사용자 락인(lock-in) 효과를 활용해 
+  결제를 넘어 보험, 투자, 대출 등으로 서비스를 확장하고 있습니다. 특히 2024년 인수한 부동산 중개 
+  플랫폼과의 시너지를 통해 부동산 금융 시장에 적극 진출했습니다.
+
+- **네이버파이낸셜**: 네이버의 검색-쇼핑-결제로 이어지는 통합 커머스 생태계를 바탕으로 스마트스토어 
+  사업자 대상 사업자 금융에 강점을 보이고 있습니다. 2024년 출시한 SME(중소기업) 특화 금융 솔루션이 
+  시장에서 좋은 반응을 얻고 있습니다.
+
+- **토스**: 가장 혁신적인 UX로 Z세대와 밀레니얼 세대의 높은 지지를 받고 있으며, 2023년 인터넷전문은행 
+  라이센스 획득 이후 예금, 대출 등 뱅킹 서비스를 강화하고 있습니다. 특히 AI 기반 재무관리 서비스에 
+  적극 투자하며 차별화를 시도하고 있습니다.
+""")
+
+# 기업 비교 차트
+st.markdown("### 국내 주요 핀테크 기업 비교 (2025년)")
+
+tab1, tab2 = st.tabs(["주요 지표 비교", "상세 분석"])
+
+with tab1:
+    # MAU 비교 차트
+    show_figure("company", metric='MAU')
+
+    # 거래액 및 제휴사 비교
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_figure("company", metric='transactions')
+
+    with col2:
+        show_figure("company", metric='partners')
+
+with tab2:
+    st.write("""
+    ### 카카오페이 분석
+    2025년 1분기 기준 카카오페이는 결제·금융 부문을 포함해 총 4천억원의 분기 매출을 달성했으며, 
+    특히 보험 중개 사업의 성장이 두드러졌습니다. 미래 성장 동력으로는 2024년 말부터 시작한 
+    '카카오페이 모기지' 서비스가 주목받고 있으며, 6개월 만에 5천억원의 대출 취급액을 달성했습니다.
+
+    ### 네이버파이낸셜 분석
+    네이버파이낸셜은 스마트스토어 사업자 대상 선정산, 대출 서비스를 중심으로 사업자 금융에 강점을 
+    보이고 있습니다. 특히 네이버의 방대한 데이터를 활용한 대안신용평가시스템(ACSS)을 통해 
+    기존 금융권에서 충분한 평가를 받지 못했던 소상공인들에게 금융 기회를 제공하고 있습니다.
+
+    ### 토스 분석
+    토스는 2023년 인터넷전문은행 라이센스 획득 후 예금 및 대출 상품을 확대하며 뱅킹 서비스를 
+    강화하고 있습니다. 특히 2024년 출시한 '토스 AI 재무코치'는 출시 3개월 만에 300만 명의 
+    사용자를 확보하며 시장의 주목을 받았습니다. 현재 증권, 보험 등 자산관리 서비스로의 
+    확장을 적극 추진 중입니다.
+    """)
+
+st.caption("출처: 카카오페이·네이버파이낸셜·토스 IR 자료, 한국핀테크산업협회")
+
+# 글로벌 핀테크 기업 동향
+st.markdown('<p class="subsection-header">3.2 글로벌 핀테크 동향</p>', unsafe_allow_html=True)
+
+# 3.2 글로벌 핀테크 동향 (이어서)
+st.write("""
+글로벌 핀테크 시장은 2025년 현재 다음과 같은 주요 흐름을 보이고 있습니다:
+
+1. **빅테크의 금융 진출 가속화**
+   - 애플: 애플카드 출시 이후 2024년 애플 세이빙스(Apple Savings) 서비스로 예금 시장 진출
+   - 메타(구 페이스북): 2023년 메타페이 출시 이후 암호화폐 결제 시스템 확장
+   - 아마존: 아마존페이 외에도 2024년부터 소상공인 대상 '아마존 비즈니스 캐피털' 서비스 강화
+
+2. **슈퍼앱(Super App) 경쟁 심화**
+   - 중국 위챗페이, 알리페이의 성공 모델을 벤치마킹한 슈퍼앱 전략이 글로벌로 확산
+   - 동남아시아의 그랩(Grab)과 고젝(Gojek)은 라이드헤일링에서 시작해 금융, 식품배달 등으로 확장
+   - 브라질 누뱅크(Nubank)는 2024년 1억 사용자를 돌파하며 남미 최대 디지털 뱅크로 성장
+
+3. **핀테크 투자 재개**
+   - 2022-2023년 긴축 환경에서 주춤했던 글로벌 핀테크 투자가 2024년부터 회복세
+   - 특히 B2B 핀테크, 임베디드 파이낸스, 레그텍(RegTech) 분야에 투자 집중
+   - 2025년 1분기 글로벌 핀테크 투자액은 전년 동기 대비 28% 증가한 157억 달러 기록
+
+4. **IPO 및 M&A 활성화**
+   - 2024년 핀테크 유니콘의 IPO 러시 (스트라이프, 클라르나 등)
+   - 2025년 1분기 핀테크 분야 M&A 건수 87건으로 전년 동기 대비 35% 증가
+   - 핀테크-전통금융 간 인수합병 증가 추세
+""")
+
+# 글로벌 핀테크 투자 트렌드 시각화
+st.markdown("### 글로벌 핀테크 투자 추이")
+show_figure("investment")
+st.caption("출처: KPMG Pulse of Fintech 2025 Q1")
@@ -0,0 +1,79 @@
+import streamlit as st
+
+from research_common import show_figure
+
+# 6. 결론 및 참고문헌
+st.markdown('<p class="main-header">6. 결론: 금융의 미래를 위한 제언</p>', unsafe_allow_html=True)
+
+st.write("""
+핀테크 산업은 2025년 현재 금융 서비스의 본질을 근본적으로 변화시키고 있으며, 
+이러한 혁신의 물결은 향후에도 지속될 것으로 예상됩니다. 본 보고서의 분석을 토대로 
+핀테크의 미래를 준비하기 위한 주요 제언은 다음과 같습니다:
+
+1. **기술 투자 확대**
+   - AI와 블록체인 등 핵심 기술 R&D 예산 2배 이상 확대
+   - 특히 금융 서비스의 초개인화를 위한 AI 응용 연구에 집중
+   - 양자내성암호(PQC) 등 미래 보안 기술에 선제적 투자
+
+2. **규제 샌드박스 강화**
+   - 혁신적 금융 서비스를 실험할 수 있는 테스트베드 확대
+   - 국가간 규제 조화를 위한 글로벌 협력 채널 구축
+   - 민간 주도의 자율규제와 공적 규제의 균형점 모색
+
+3. **소비자 교육 강화**
+   - 디지털 금융 리터러시 프로그램 의무화
+   - 금융소비자 보호를 위한 알기 쉬운 정보 제공 표준화
+   - 디지털 금융 사기 예방을 위한 인식 제고 캠페인 실시
+
+4. **생태계 협력 강화**
+   - 핀테크 스타트업-금융기관-빅테크 간 협력 모델 다각화
+   - 오픈API와 표준화를 통한 상호운용성 확대
+   - 공공-민간 파트너십을 통한 금융 혁신 기반 구축
+
+5. **포용적 금융 실현**
+   - 디지털 소외계층을 위한 접근성 개선 방안 마련
+   - 대안 신용평가 모델을 통한 금융 접근성 확대
+   - 지역 기반 금융 서비스와 핀테크의 결합 모델 발굴
+""")
+
+# 핵심 제언 시각화
+st.markdown("### 핀테크 발전을 위한 핵심 제언")
+show_figure("recommendation")
+
+# 맺음말
+st.markdown('<p class="subsection-header">6.1 맺음말: 디지털 금융의 미래</p>', unsafe_allow_html=True)
+
+st.write("""
+핀테크 산업은 2025년을 기점으로 성숙기에 진입하고 있습니다. 초기의 단순 서비스 디지털화에서 벗어나
+금융의 본질적 기능을 재정의하고 혁신하는 단계로 진화하고 있습니다. 특히 주목할 점은 금융과 비금융의
+경계가 빠르게 허물어지고 있다는 점입니다.
+
+금융서비스가 일상 생활의 다양한 영역에 자연스럽게 통합되는 '임베디드 파이낸스'는 이제 단순한 트렌드가
+아닌 핵심 비즈니스 모델로 자리잡고 있습니다. 또한 AI와 빅데이터를 활용한 초개인화 금융 서비스는
+고객 경험을 근본적으로 변화시키고 있습니다.
+
+향후 핀테크 산업의 지속가능한 성장을 위해서는 혁신과 안정성, 포용성과 효율성 사이의 균형이 중요합니다.
+이를 위해 산업계, 정부, 학계, 소비자 간의 긴밀한 소통과 협력이 필수적입니다.
+
+본 보고서가 한국 핀테크 산업의 현재를 진단하고 미래를 준비하는 데 유용한 참고자료가 되기를 바랍니다.
+""")
+
+# 참고문헌
+st.markdown('<p class="subsection-header">6.2 참고문헌</p>', unsafe_allow_html=True)
+
+references = [
+    "금융위원회 (2024). 「2025년 금융산업 전망과 과제」. 서울: 금융위원회.",
+    "금융감독원 (2025). 「핀테크 산업 동향 분석」. 서울: 금융감독원.",
+    "한국은행 (2025). 「중앙은행 디지털화폐(CBDC) 추진 현황」. 서울: 한국은행.",
+    "한국핀테크산업협회 (2024). 「핀테크 기업 실태조사」. 서울: 한국핀테크산업협회.",
+    "삼정KPMG (2025). 「글로벌 핀테크 트렌드 리포트」. 서울: 삼정KPMG.",
+    "BCiF (2025). 「Blockchain in Finance 2025」. London: BCiF Research.",
+    "Gartner (2024). 「금융서비스 기술 전망 2024-2025」. Stanford: Gartner Inc.",
+    "IDC (2025). 「Worldwide FinTech Spending Guide」. Framingham: IDC.",
+    "McKinsey & Company (2025). 「글로벌 핀테크 리포트」. New York: McKinsey & Company.",
+    "PwC (2025). 「핀테크 트렌드 2025」. London: PwC.",
+    "World Economic Forum (2024). 「Future of Financial Services 2025」. Geneva: WEF."
+]
+
+for i, ref in enumerate(references):
+    st.write(f"{i+1}. {ref}")
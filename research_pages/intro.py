@@ -0,0 +1,59 @@
+import streamlit as st
+
+from research_common import show_figure
+
+# 1. 서론: 핀테크 발전사
+st.markdown('<p class="main-header">1. 서론: 디지털 금융 생태계의 재편</p>', unsafe_allow_html=True)
+
+# 핀테크 정의 및 역사
+st.markdown('<p class="subsection-header">1.1 핀테크의 정의와 역사적 발전</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([7, 3])
+
+with col1:
+    st.write("""
+    **핀테크(FinTech)**는 금융(Finance)과 기술(Technology)의 합성어로, 정보기술(IT)을 기반으로 한 새로운 형태의 금융 서비스와 산업을 의미합니다. 
+
+    1990년대 후반 인터넷의 확산과 함께 시작된 온라인 뱅킹이 초기 핀테크의 모습이라면, 2008년 글로벌 금융위기 이후 금융 산업의 혁신 필요성과 
+    스마트폰의 보급이 맞물려 현대적 의미의 핀테크가 본격적으로 성장하기 시작했습니다.
+
+    핀테크의 발전은 크게 다음 단계로 구분할 수 있습니다:
+
+    - **핀테크 1.0 (1998-2008)**: 인터넷 뱅킹, 온라인 결제 시스템 등장
+    - **핀테크 2.0 (2009-2014)**: 모바일 뱅킹, P2P 대출, 비트코인 등장
+    - **핀테크 3.0 (2015-2019)**: 간편결제, 로보어드바이저, 인슈어테크 성장
+    - **핀테크 4.0 (2020-현재)**: AI 기반 초개인화, 임베디드 파이낸스, CBDC 도입
+
+    특히 2020년 코로나19 팬데믹은 비대면 금융 서비스의 수요를 급증시키며 핀테크 산업의 질적·양적 성장을 가속화했습니다. 
+    2025년 현재는 AI와 블록체인이 금융 산업의 근본적 변화를 이끌고 있습니다.
+    """)
+
+with col2:
+    st.markdown('<div class="insight-box">', unsafe_allow_html=True)
+    st.markdown("""
+    ### 핵심 인사이트
+
+    - 2020-2025년 CAGR: **24.3%**
+    - 2025년 핵심 기술: AI, 블록체인
+    - 주요 성장 동력: 초개인화 금융서비스
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# 핀테크 타임라인 시각화
+st.markdown("### 핀테크 주요 발전 단계")
+show_figure("timeline")
+st.caption("출처: BCiF 리포트, 헥토데이터 핀테크 역사 분석")
+
+# 핀테크 생태계 구성
+st.markdown('<p class="subsection-header">1.2 핀테크 생태계 현황</p>', unsafe_allow_html=True)
+st.write("""
+2025년 현재 핀테크 생태계는 전통 금융기관과 신생 테크 기업, 그리고 빅테크 기업의 복합적인 경쟁과 협력 구도를 형성하고 있습니다.
+특히 주목할 만한 점은 **금융의 임베디드화(Embedded Finance)** 현상으로, 금융 서비스가 비금융 플랫폼 및 앱에 통합되어 
+제공되는 형태가 확산되고 있습니다.
+
+2022년부터 시작된 금리 상승기와 2023-2024년의 글로벌 경기 둔화에도 불구하고, 핀테크 산업은 꾸준히 성장해왔습니다.
+이는 디지털 전환이 선택이 아닌 필수가 된 환경에서 금융 서비스의 혁신이 지속적으로 요구되기 때문입니다.
+
+또한, '초연결 금융(Hyper-connected Finance)' 트렌드가 가속화되면서 다양한 금융 서비스가 API와 오픈뱅킹을 통해
+연결되고 있으며, 이는 소비자에게 통합된 금융 경험을 제공하는 핵심 요소가 되고 있습니다.
+""")
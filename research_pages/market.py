@@ -0,0 +1,74 @@
+import streamlit as st
+
+from research_common import show_figure
+from research_data import load_frame
+
+# 2. 시장 현황 및 트렌드
+st.markdown('<p class="main-header">2. 시장 현황 및 트렌드 분석</p>', unsafe_allow_html=True)
+
+# 글로벌 시장 규모
+st.markdown('<p class="subsection-header">2.1 글로벌 시장 규모 및 성장 동력</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([6, 4])
+
+with col1:
+    st.write("""
+    핀테크 글로벌 시장은 2020년 550조 원에서 2025년 1,550조 원으로 폭발적인 성장을 기록했습니다.
+    특히 코로나19 이후 비대면 서비스 수요 증가와 디지털 전환 가속화로 인해 연평균 24.3%라는 고성장세를 유지했습니다.
+
+    지역별로는 북미와 아시아태평양 지역이 시장을 주도하고 있으며, 특히 인도와 동남아시아에서 급격한 성장세가 두드러집니다.
+    이 지역들은 높은 모바일 보급률과 젊은 인구 구성, 그리고 상대적으로 낮은 기존 금융 인프라 보급률이 핀테크 서비스 채택의 
+    가속화 요인이 되고 있습니다.
+
+    세부 분야별로는 디지털 결제가 여전히 가장 큰 시장 점유율(43%)을 차지하고 있으나, 최근 들어 **임베디드 파이낸스(Embedded Finance)**와
+    **디파이(DeFi)** 영역이 빠르게 성장하고 있습니다. 특히 디파이는 2024년부터 규제 프레임워크가 점차 명확해지면서
+    기관 투자자들의 참여가 증가하는 추세입니다.
+    """)
+
+with col2:
+    # 시장 규모 표
+    st.markdown('<div class="table-wrapper">', unsafe_allow_html=True)
+    st.table(load_frame("market_table").set_index('구분'))
+    st.markdown('</div>', unsafe_allow_html=True)
+    st.caption("출처: IDC 글로벌 핀테크 전망 보고서 2025")
+
+# 시장 성장 추이 시각화
+st.markdown("### 핀테크 글로벌 시장 성장 추이 (2020-2027)")
+show_figure("market")
+st.caption("출처: IDC 글로벌 핀테크 전망 2025, BCiF 리포트")
+
+# 핵심 트렌드
+st.markdown('<p class="subsection-header">2.2 2025 핵심 트렌드</p>', unsafe_allow_html=True)
+
+st.write("""
+2025년 핀테크 산업의 핵심 트렌드는 다음과 같습니다:
+
+1. **초개인화 금융(Hyper-personalized Finance)**
+   - AI와 빅데이터를 활용한 고객별 맞춤형 금융 서비스 제공
+   - 행동 패턴 분석을 통한 선제적 금융 솔루션 제안
+   - 예: 소비 패턴 기반의 개인화된 보험 상품, 자산 포트폴리오 자동 조정
+
+2. **임베디드 파이낸스(Embedded Finance)**
+   - 비금융 플랫폼에 금융 서비스 통합
+   - 전자상거래, 모빌리티, 헬스케어 등 다양한 분야에 금융 기능 내재화
+   - 예: 전자상거래 플랫폼 내 BNPL(Buy Now Pay Later) 서비스
+
+3. **중앙은행 디지털화폐(CBDC) 도입 확산**
+   - 2024년 중국 디지털 위안화 전면 도입 이후 각국 중앙은행 참여 확대
+   - 한국은행 2025년 하반기 파일럿 프로그램 확대 예정
+   - 디지털화폐 기반 국가간 결제 시스템 표준화 논의 활발
+
+4. **금융 포용성 확대(Financial Inclusion)**
+   - 전통 금융시스템에서 소외된 계층을 위한 서비스 강화
+   - 신용 평가 다변화를 통한 금융 접근성 향상
+   - 예: 한국의 '청년금융특별법' 시행으로 Z세대 특화 금융 상품 확대
+
+5. **그린 핀테크(Green FinTech)**
+   - ESG 투자와 지속가능 금융의 디지털화
+   - 탄소 배출량 추적 및 오프셋 기능 통합
+   - 예: 지속가능한 소비에 보상을 제공하는 그린카드 서비스
+""")
+
+# 트렌드 시각화
+show_figure("trends")
+st.caption("출처: 삼정KPMG CES 2025 트렌드 보고서, 한국핀테크산업협회")
@@ -0,0 +1,120 @@
+import streamlit as st
+
+from research_common import show_figure
+
+# 5. 향후 전망 및 리스크
+st.markdown('<p class="main-header">5. 향후 전망 및 리스크 관리</p>', unsafe_allow_html=True)
+
+# 2027년 예측 시나리오
+st.markdown('<p class="subsection-header">5.1 2027년 예측 시나리오</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([7, 3])
+
+with col1:
+    st.write("""
+    핀테크 산업은 2025년 이후에도 지속적인 성장이 예상되며, 2027년까지의 전망은 다음과 같습니다:
+
+    **긍정적 시나리오 (성장 가속화)**
+    - **시장 규모**: 글로벌 시장 2,200조 원 돌파
+    - **주요 성장 동력**: 
+      - AI 기반 초개인화 금융 서비스 보편화
+      - 금융과 비금융 경계의 완전한 붕괴 (임베디드 파이낸스 확산)
+      - CBDC의 본격적인 상용화와 국가간 호환성 확보
+      - 마이데이터 기반 맞춤형 보험, 투자 상품 확대
+    - **기업 환경**:
+      - 핀테크-전통 금융 간 대규모 M&A 활성화
+      - 2027년까지 글로벌 Top 10 은행 중 3개는 핀테크 출신 기업으로 대체
+
+    **중립적 시나리오 (안정적 성장)**
+    - **시장 규모**: 글로벌 시장 2,000조 원 달성
+    - **주요 특징**:
+      - 일부 핀테크 영역에서의 수익성 문제 지속
+      - 규제 환경의 불확실성으로 일부 서비스 출시 지연
+      - 빅테크와 전통 금융 기관의 디지털 전환으로 경쟁 심화
+
+    **부정적 시나리오 (성장 둔화)**
+    - **시장 규모**: 글로벌 시장 1,850조 원 수준
+    - **주요 위험 요소**:
+      - 대규모 사이버 보안 사고에 따른 소비자 신뢰 하락
+      - 글로벌 경기침체로 인한 투자 감소
+      - 규제 강화로 인한 혁신 서비스 출시 제약
+    """)
+
+with col2:
+    st.markdown('<div class="insight-box">', unsafe_allow_html=True)
+    st.markdown("""
+    ### 2027년 핵심 예측
+
+    - 시장 규모: 2,000-2,200조 원
+    - 연평균 성장률: 15-20%
+    - 최대 성장 분야: DeFi, 임베디드 파이낸스
+    - 신규 사용자: 20억 명 이상
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# 시나리오별 시장 규모 전망
+st.markdown("### 시나리오별 핀테크 시장 규모 전망")
+show_figure("scenario")
+
+# 리스크 요인
+st.markdown('<p class="subsection-header">5.2 주요 리스크 요인</p>', unsafe_allow_html=True)
+
+st.write("""
+핀테크 산업이 직면한 주요 리스크 요인은 다음과 같습니다:
+
+1. **사이버 보안 위협**
+   - 2023-2025년 핀테크 대상 해킹 시도 230% 증가
+   - 특히 AI 기반 딥페이크를 활용한 신원 도용 위협 급증
+   - 클라우드 기반 금융 서비스의 취약점 악용 사례 증가
+
+2. **규제 불확실성**
+   - 글로벌 규제 프레임워크의 비일관성으로 인한 국가간 서비스 확장 어려움
+   - 데이터 주권 관련 규제 강화로 국경간 데이터 이동 제약 가능성
+   - 탈중앙화 금융(DeFi)에 대한 규제 프레임워크 불확실성 지속
+
+3. **기술 의존도 심화**
+   - 핵심 기술 공급업체에 대한 의존도 증가로 시스템 리스크 확대
+   - 오픈소스 및 API 의존성으로 인한 공급망 보안 위험
+   - AI 알고리즘의 '블랙박스' 문제로 인한 설명가능성 이슈
+
+4. **고객 신뢰 확보**
+   - 디지털 신원 관리 및 개인정보 보호에 대한 우려 증가
+   - 금융 소비자 보호 관점에서의 책임 소재 불명확성
+   - 디지털 격차(Digital Divide)로 인한 금융 소외 위험
+""")
+
+# 리스크 요소 시각화
+st.markdown("### 주요 리스크 요소 분석")
+show_figure("risk")
+st.caption("출처: KISA 사이버보안 동향 보고서, 금융감독원 리스크 평가")
+
+# 리스크 대응 전략
+st.markdown('<p class="subsection-header">5.3 리스크 대응 전략</p>', unsafe_allow_html=True)
+
+st.write("""
+향후 핀테크 산업의 지속가능한 성장을 위한 리스크 대응 전략은 다음과 같습니다:
+
+1. **사이버 보안 강화**
+   - 제로트러스트(Zero Trust) 아키텍처 도입 확대
+   - AI 기반 이상탐지 시스템 고도화
+   - 양자암호 도입을 통한 미래 보안 위협 대비
+   - 업계 공동의 사이버 위협 인텔리전스 공유 플랫폼 구축
+
+2. **규제 대응 체계 구축**
+   - 선제적 규제 모니터링 및 컴플라이언스 자동화
+   - 레그텍(RegTech) 솔루션 고도화
+   - 규제당국과의 개방적 커뮤니케이션 채널 유지
+   - 자율규제 체계 확립을 통한 산업 신뢰 제고
+
+3. **기술 리스크 관리**
+   - 핵심 기술에 대한 멀티벤더 전략 구축
+   - 온프레미스-클라우드 하이브리드 아키텍처 운영
+   - 오픈소스 의존성 관리 및 취약점 모니터링 강화
+   - 상시 재해복구 훈련 및 비즈니스 연속성 계획 고도화
+
+4. **소비자 신뢰 확보**
+   - 투명한 정보 제공 및 금융 교육 강화
+   - 디지털 취약계층을 위한 접근성 개선
+   - 고객 데이터 사용에 대한 옵트인(opt-in) 원칙 강화
+   - 분쟁 해결 프로세스 간소화 및 신속화
+""")
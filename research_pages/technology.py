@@ -0,0 +1,78 @@
+import streamlit as st
+
+from research_common import show_figure
+from research_data import load_frame
+
+# 4. 기술 혁신과 규제 환경
+st.markdown('<p class="main-header">4. 기술 혁신 및 규제 환경</p>', unsafe_allow_html=True)
+
+# 핵심 기술 도입 현황
+st.markdown('<p class="subsection-header">4.1 핵심 기술 도입 현황</p>', unsafe_allow_html=True)
+
+col1, col2 = st.columns([6, 4])
+
+with col1:
+    st.write("""
+    2025년 현재 핀테크 산업의 핵심 기술은 **인공지능(AI)**, **블록체인**, **생체인증** 등이 주도하고 있습니다.
+
+    **인공지능(AI) 신용평가 시스템**은 기존 신용평가 모델이 포착하지 못했던 다양한 데이터 포인트를 활용해
+    더 정교하고 포용적인 신용평가를 가능하게 하고 있습니다. 이는 특히 신용 이력이 부족한 젊은 세대와
+    금융 소외계층에게 혜택을 제공하고 있습니다.
+
+    **블록체인 기술**은 중앙은행 디지털화폐(CBDC), 디지털 자산 관리, 그리고 스마트 계약을 통한 보험금
+    자동 지급 등의 분야에 적용되고 있습니다. 특히 2023년 이후 규제 프레임워크가 구체화되면서
+    기관 투자자의 참여가 크게 증가했습니다.
+
+    **생체인증 기술**은 모바일 금융 앱의 보안성과 편의성을 동시에 향상시키는 핵심 요소로 자리잡았습니다. 
+    얼굴 인식, 지문 인식을 넘어 음성 인식, 행동 패턴 분석 등 다중 생체인증 방식이 확산되고 있습니다.
+
+    특히 2024년부터는 **양자암호** 기술이 금융 보안 분야에 적용되기 시작했으며, 이는 양자컴퓨팅 시대에 대비한
+    선제적 보안 강화 조치로 평가받고 있습니다.
+    """)
+
+with col2:
+    # 기술 도입률 표
+    st.markdown('<div class="table-wrapper">', unsafe_allow_html=True)
+    st.table(load_frame("tech_table").set_index('기술'))
+    st.markdown('</div>', unsafe_allow_html=True)
+    st.caption("출처: 금융감독원 핀테크 기술 동향 보고서 2025")
+
+# 기술 도입 추이 시각화
+st.markdown("### 핵심 기술 도입률 및 예상 성장률")
+show_figure("tech")
+
+# 규제 환경
+st.markdown('<p class="subsection-header">4.2 규제 환경 변화</p>', unsafe_allow_html=True)
+
+st.write("""
+핀테크 산업의 규제 환경은 지속적으로 변화하고 있으며, 2025년 주요 규제 동향은 다음과 같습니다:
+
+1. **규제 샌드박스 확대**
+   - 한국은 2023년 '디지털금융혁신법' 제정으로 기존 규제 샌드박스를 확대
+   - 2025년 현재 총 127개 서비스가 규제 샌드박스를 통해 테스트 중
+   - 특히 AI 금융 상담, P2P 대출, 대체 신용평가 분야에 집중
+
+2. **오픈뱅킹 고도화**
+   - 2024년 '오픈뱅킹 2.0' 출범으로 데이터 공유 범위 확대
+   - 은행 계좌 정보뿐만 아니라 보험, 증권, 카드 데이터까지 API로 연동
+   - 2025년 3월 기준 오픈뱅킹 참여기관 118개, 등록 이용자 6,750만 명 돌파
+
+3. **CBDC 규제 프레임워크 구축**
+   - 한국은행의 '디지털 원화' 파일럿 프로그램 단계적 확대
+   - 2025년 상반기 금융기관 대상 테스트를 거쳐 하반기 일반 사용자 대상 확대 예정
+   - CBDC 운영을 위한 법적 근거 마련 ('한국은행법' 개정안 2024년 통과)
+
+4. **개인정보보호 강화**
+   - 2024년 개인정보보호법 개정으로 '마이데이터 2.0' 시행
+   - 정보주체의 데이터 이동권 및 통제권 강화
+   - 금융회사의 데이터 보호 책임 강화 (위반 시 매출액 5%까지 과징금 부과)
+
+5. **금융지주회사법 개정**
+   - 2024년 개정으로 핀테크 기업 지분 보유 한도 5% → 15% 확대
+   - 금융그룹과 핀테크 기업 간 합종연횡 가속화 예상
+""")
+
+# 주요 규제 변화 타임라인
+st.markdown("### 핀테크 규제 환경 주요 변화")
+show_figure("regulation")
+st.caption("출처: 금융감독원, 한국은행, 금융위원회 자료 종합")
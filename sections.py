@@ -0,0 +1,76 @@
+# 입력 폼의 항목별 필드 정의 (input_form_page 와 배치 보고서가 같이 사용)
+SECTION_FIELDS = {
+    "세금 관리": {"연소득": int, "부양가족 수": int},
+    "투자 관리": {"종목 이름": str, "보유 주식 수": int, "주당 가격": float},
+    "연금 관리": {"월 납입액": int, "납입 기간": int, "연 이자율": float},
+    "보험 관리": {"보험 이름": str, "월 보험료": int, "보장 금액": int},
+}
+
+SECTIONS = list(SECTION_FIELDS)
+
+
+def _convert(value, field_type):
+    if field_type is str:
+        return str(value).strip()
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    return field_type(float(value)) if field_type is int else field_type(value)
+
+
+# 제출된 항목 값 검증, 문제가 있으면 메시지 목록을 돌려줌
+def validate_section(section, data):
+    errors = []
+    if section == "세금 관리":
+        if data["연소득"] <= 0:
+            errors.append("세금 관리: 연소득을 입력해주세요.")
+    elif section == "투자 관리":
+        if not data["종목 이름"].strip():
+            errors.append("투자 관리: 종목 이름을 입력해주세요.")
+        if data["보유 주식 수"] <= 0 or data["주당 가격"] <= 0:
+            errors.append("투자 관리: 보유 주식 수와 주당 가격은 0보다 커야 합니다.")
+    elif section == "연금 관리":
+        if data["월 납입액"] <= 0 or data["납입 기간"] <= 0:
+            errors.append("연금 관리: 월 납입액과 납입 기간은 0보다 커야 합니다.")
+        if not 0 <= data["연 이자율"] <= 100:
+            errors.append("연금 관리: 연 이자율은 0~100% 사이여야 합니다.")
+    elif section == "보험 관리":
+        if not data["보험 이름"].strip():
+            errors.append("보험 관리: 보험 이름을 입력해주세요.")
+    return errors
+
+
+# 항목별 dict 를 스키마에 맞춰 정리한 user_data 로 변환 (비어 있는 항목은 제외)
+def normalize_user_data(raw):
+    user_data = {}
+    for section, fields in SECTION_FIELDS.items():
+        data = raw.get(section)
+        if not data:
+            continue
+        values = {}
+        for field, field_type in fields.items():
+            value = data.get(field)
+            if value is None or value == "":
+                raise ValueError(f"{section} 항목의 '{field}' 값이 없습니다.")
+            try:
+                values[field] = _convert(value, field_type)
+            except ValueError:
+                raise ValueError(f"{section} 항목의 '{field}' 값이 올바르지 않습니다: {value!r}")
+        errors = validate_section(section, values)
+        if errors:
+            raise ValueError(" ".join(errors))
+        user_data[section] = values
+    if not user_data:
+        raise ValueError("입력된 항목이 없습니다.")
+    return user_data
+
+
+# CSV 한 줄 ("세금 관리.연소득" 형식의 열) 을 항목별 dict 로 묶기
+def sections_from_flat(row):
+    raw = {}
+    for column, value in row.items():
+        if column is None or "." not in column:
+            continue
+        section, field = column.split(".", 1)
+        if section in SECTION_FIELDS and value not in (None, ""):
+            raw.setdefault(section, {})[field] = value
+    return raw
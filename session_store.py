@@ -0,0 +1,312 @@
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+# 세션 저장소 설정 (환경 변수로 조정)
+SESSION_STORE = os.getenv("SESSION_STORE", "sqlite")  # sqlite | memory
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", os.path.join(".cache", "sessions.sqlite3"))
+SESSION_TTL = float(os.getenv("SESSION_TTL", str(7 * 24 * 3600)))  # 초, 이 시간 동안 바뀌지 않은 세션은 삭제
+SESSION_IDLE_SECONDS = float(os.getenv("SESSION_IDLE_SECONDS", "600"))  # 이 시간 동안 실행이 없으면 대화 기록을 메모리에서 내림
+SESSION_SWEEP_INTERVAL = 60  # 유휴 세션 정리 주기 (초)
+
+# 저장하는 session_state 키 (chat_history 는 메시지 단위로 따로 저장)
+PERSISTED_KEYS = ("page", "selected_sections", "user_data")
+# 저장하지 않고 유휴 세션에서 비우는 캐시 (dict, 비워지면 다음에 필요할 때 새로 만듦)
+OFFLOADED_KEYS = ("report_pdf",)
+SESSION_COOKIE = os.getenv("SESSION_COOKIE", "advisor_sid")
+SESSION_QUERY_PARAM = "sid"  # 예전 버전이 URL 에 넣던 세션 ID (지금은 지우기만 함)
+_SESSION_ID = re.compile(r"[A-Za-z0-9_-]{16,64}")
+
+
+# 세션 저장소 인터페이스. 다른 저장소(Redis 등)는 아래 메서드를 같은 의미로 구현하고
+# get_session_store 에 등록하면 됨. 모든 메서드는 여러 스레드에서 동시에 호출될 수 있음.
+#  - load_values(session_id): 저장된 {키: 값} (없으면 빈 dict)
+#  - save_values(session_id, values): 주어진 키만 덮어씀 (값은 JSON 으로 직렬화 가능)
+#  - load_messages(session_id): 저장된 대화 기록 목록
+#  - append_messages(session_id, messages): 저장된 마지막 메시지 뒤에 추가 (같은 세션을 쓰는 탭/프로세스가 동시에
+#    추가해도 서로 덮어쓰지 않도록 위치는 저장소가 정함)
+#  - purge(ttl): ttl 초 동안 바뀌지 않은 세션 삭제
+#
+# 보안 전제: 세션 ID 하나만 알면 그 세션(소득, 보유 자산, 상담 기록 전체)을 그대로 불러올 수 있고 다른 확인은 없음.
+# 그래서 세션 ID 는 URL 에 넣지 않고 SameSite=Strict 쿠키로만 주고받음 (북마크, 공유 링크, 방문 기록, Referer 로 새지 않음).
+# 쿠키는 화면의 스크립트로 쓰므로 HttpOnly 가 아님 (앱에 스크립트 삽입이 가능하면 읽힐 수 있음).
+# 같은 브라우저의 탭들은 한 세션을 나눠 씀. 저장소 구현은 세션 ID 를 비밀번호처럼 다루고 로그에 남기지 말 것.
+class SessionStore:
+    def load_values(self, session_id):
+        raise NotImplementedError
+
+    def save_values(self, session_id, values):
+        raise NotImplementedError
+
+    def load_messages(self, session_id):
+        raise NotImplementedError
+
+    def append_messages(self, session_id, messages):
+        raise NotImplementedError
+
+    def purge(self, ttl):
+        raise NotImplementedError
+
+
+# 프로세스 하나에서만 쓰는 저장소 (개발용, 재시작하면 사라짐)
+class MemorySessionStore(SessionStore):
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _session(self, session_id):
+        session = self._sessions.setdefault(session_id, {"values": {}, "messages": [], "updated": 0.0})
+        session["updated"] = time.time()
+        return session
+
+    def load_values(self, session_id):
+        with self._lock:
+            return json.loads(json.dumps(self._sessions.get(session_id, {}).get("values", {})))
+
+    def save_values(self, session_id, values):
+        with self._lock:
+            self._session(session_id)["values"].update(json.loads(json.dumps(values)))
+
+    def load_messages(self, session_id):
+        with self._lock:
+            return [dict(m) for m in self._sessions.get(session_id, {}).get("messages", [])]
+
+    def append_messages(self, session_id, messages):
+        with self._lock:
+            self._session(session_id)["messages"].extend(dict(m) for m in messages)
+
+    def purge(self, ttl):
+        with self._lock:
+            cutoff = time.time() - ttl
+            for session_id in [k for k, v in self._sessions.items() if v["updated"] < cutoff]:
+                del self._sessions[session_id]
+
+
+# 여러 서버 프로세스가 같은 파일을 공유하는 SQLite (WAL) 저장소
+class SQLiteSessionStore(SessionStore):
+    def __init__(self, path=SESSION_STORE_PATH):
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, updated REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS session_values ("
+            "session_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "PRIMARY KEY (session_id, key))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS session_messages ("
+            "session_id TEXT NOT NULL, position INTEGER NOT NULL, role TEXT NOT NULL, content TEXT NOT NULL, "
+            "PRIMARY KEY (session_id, position))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated)")
+        self._db.commit()
+
+    def _touch(self, session_id):
+        self._db.execute(
+            "INSERT INTO sessions (session_id, updated) VALUES (?, ?) "
+            "ON CONFLICT (session_id) DO UPDATE SET updated = excluded.updated",
+            (session_id, time.time()),
+        )
+
+    def load_values(self, session_id):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, value FROM session_values WHERE session_id = ?", (session_id,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def save_values(self, session_id, values):
+        rows = [(session_id, key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()]
+        with self._lock:
+            self._touch(session_id)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO session_values (session_id, key, value) VALUES (?, ?, ?)", rows
+            )
+            self._db.commit()
+
+    def load_messages(self, session_id):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT role, content FROM session_messages WHERE session_id = ? ORDER BY position",
+                (session_id,),
+            ).fetchall()
+        return [{"role": role, "content": content} for role, content in rows]
+
+    def append_messages(self, session_id, messages):
+        rows = [(session_id, m["role"], m["content"], session_id) for m in messages]
+        with self._lock:
+            # 다른 프로세스의 추가와 섞이지 않도록 쓰기 잠금을 먼저 잡고 마지막 위치 뒤에 붙임
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._touch(session_id)
+                self._db.executemany(
+                    "INSERT INTO session_messages (session_id, position, role, content) "
+                    "SELECT ?, COALESCE(MAX(position), -1) + 1, ?, ? FROM session_messages WHERE session_id = ?",
+                    rows,
+                )
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+
+    def purge(self, ttl):
+        with self._lock:
+            expired = "SELECT session_id FROM sessions WHERE updated < ?"
+            cutoff = time.time() - ttl
+            self._db.execute(f"DELETE FROM session_values WHERE session_id IN ({expired})", (cutoff,))
+            self._db.execute(f"DELETE FROM session_messages WHERE session_id IN ({expired})", (cutoff,))
+            self._db.execute("DELETE FROM sessions WHERE updated < ?", (cutoff,))
+            self._db.commit()
+
+
+# 이 프로세스에 올라와 있는 연결(탭)별 대화 기록 목록과 마지막 실행 시각
+# 같은 세션 ID 를 쓰는 탭도 기록 목록은 따로 가지므로 세션 ID 가 아니라 연결마다 발급한 키로 구분
+# 유휴 연결의 기록은 저장이 끝난 경우에만 비우고 (OFFLOADED_KEYS 캐시도 같이), 다시 실행되면 저장소에서 읽어 옴
+class ResidentHistories:
+    def __init__(self, idle_seconds=SESSION_IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.time()
+
+    # 실행 시작/종료 시 호출, 이 연결의 기록이 내려가 있었으면 True
+    def touch(self, resident_id, history, saved, caches=()):
+        with self._lock:
+            entry = self._sessions.get(resident_id)
+            offloaded = entry is not None and entry["offloaded"] and entry["history"] is history
+            self._sessions[resident_id] = {
+                "history": history,
+                "saved": saved,
+                "caches": list(caches),
+                "last_seen": time.time(),
+                "offloaded": False,
+            }
+            return offloaded
+
+    def sweep(self, store):
+        now = time.time()
+        with self._lock:
+            if now - self._last_sweep < SESSION_SWEEP_INTERVAL:
+                return
+            self._last_sweep = now
+            for resident_id, entry in list(self._sessions.items()):
+                if now - entry["last_seen"] < self.idle_seconds:
+                    continue
+                for cache in entry["caches"]:
+                    cache.clear()
+                if entry["saved"] == len(entry["history"]):
+                    entry["history"].clear()
+                    entry["offloaded"] = True
+                # 기록이 비워진 지 오래된 연결은 목록에서도 뺌 (연결이 끊긴 탭)
+                if now - entry["last_seen"] > SESSION_TTL:
+                    del self._sessions[resident_id]
+        store.purge(SESSION_TTL)
+
+
+# 서버 프로세스당 하나의 저장소를 모든 세션이 공유
+@st.cache_resource(show_spinner=False)
+def get_session_store():
+    if SESSION_STORE == "memory":
+        return MemorySessionStore()
+    if SESSION_STORE == "sqlite":
+        return SQLiteSessionStore()
+    raise ValueError(f"알 수 없는 SESSION_STORE 값입니다: {SESSION_STORE!r}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_resident_histories():
+    return ResidentHistories()
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+# 브라우저에 세션 쿠키를 씀 (쿠키는 다음 연결부터 st.context.cookies 로 읽힘, 만료 시각은 연결마다 연장)
+def _set_session_cookie(session_id):
+    cookie = f"{SESSION_COOKIE}={session_id}; Path=/; Max-Age={int(SESSION_TTL)}; SameSite=Strict"
+    st.html(
+        f"<script>document.cookie = {json.dumps(cookie)} + (location.protocol === 'https:' ? '; Secure' : '');</script>",
+        unsafe_allow_javascript=True,
+    )
+
+
+# 실행 시작 시 호출: 쿠키의 세션 ID 로 저장된 상태를 복원 (처음 접속이면 새 ID 발급)
+def restore_session(session):
+    # 예전 ?sid= 링크는 이미 북마크/공유로 새어 나갔을 수 있으므로 주소에서 지우고 복원에 쓰지 않음
+    if SESSION_QUERY_PARAM in st.query_params:
+        del st.query_params[SESSION_QUERY_PARAM]
+
+    session_id = session.get("session_id")
+    if session_id is None:
+        session_id = st.context.cookies.get(SESSION_COOKIE)
+        # 브라우저 연결이 없으면 (AppTest 등) 쿠키 대신 문자열이 아닌 값이 옴
+        if not isinstance(session_id, str) or not _SESSION_ID.fullmatch(session_id):
+            session_id = secrets.token_urlsafe(16)
+
+    store = get_session_store()
+    if session.get("session_id") != session_id:
+        _set_session_cookie(session_id)
+        # 새 연결 (재접속, 다른 서버 프로세스): 저장된 값으로 덮어씀
+        values = store.load_values(session_id)
+        for key, value in values.items():
+            session[key] = value
+        session["chat_history"] = store.load_messages(session_id)
+        session["chat_summary"] = {}
+        session["session_id"] = session_id
+        session["_resident_id"] = secrets.token_hex(8)
+        session["_persisted"] = {key: _dump(value) for key, value in values.items()}
+        session["_persisted"]["messages"] = len(session["chat_history"])
+
+    history = session["chat_history"]
+    saved = session["_persisted"]["messages"]
+    if get_resident_histories().touch(session["_resident_id"], history, saved, _caches(session)):
+        history[:] = store.load_messages(session_id)
+        session["_persisted"]["messages"] = len(history)
+
+
+def _caches(session):
+    return [session[key] for key in OFFLOADED_KEYS if key in session]
+
+
+# 실행 끝에 호출: 바뀐 키와 새 메시지만 저장하고 유휴 세션의 기록을 메모리에서 내림
+def persist_session(session):
+    session_id = session.get("session_id")
+    if session_id is None:
+        return
+    store = get_session_store()
+    persisted = session["_persisted"]
+
+    changed = {}
+    for key in PERSISTED_KEYS:
+        raw = _dump(session[key])
+        if persisted.get(key) != raw:
+            changed[key] = session[key]
+            persisted[key] = raw
+    if changed:
+        store.save_values(session_id, changed)
+
+    # 새 메시지만 뒤에 붙임. 기록이 저장된 것보다 짧으면 (다른 곳에서 비워진 목록 등) 저장하지 않고 다시 읽어 옴
+    history = session["chat_history"]
+    saved = persisted["messages"]
+    if len(history) < saved:
+        history[:] = store.load_messages(session_id)
+    elif len(history) > saved:
+        store.append_messages(session_id, history[saved:])
+    persisted["messages"] = len(history)
+
+    residents = get_resident_histories()
+    residents.touch(session["_resident_id"], history, len(history), _caches(session))
+    residents.sweep(store)
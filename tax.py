@@ -0,0 +1,93 @@
+import numpy as np
+
+# 금액 단위는 입력 폼과 같은 만원
+
+# 종합소득세 과세표준 구간 (하한, 세율)
+TAX_BRACKETS = [
+    (0, 0.06),
+    (1400, 0.15),
+    (5000, 0.24),
+    (8800, 0.35),
+    (15000, 0.38),
+    (30000, 0.40),
+    (50000, 0.42),
+    (100000, 0.45),
+]
+
+# 근로소득공제 구간 (하한, 공제율), 한도 2000만원
+EARNED_INCOME_DEDUCTION = [
+    (0, 0.70),
+    (500, 0.40),
+    (1500, 0.15),
+    (4500, 0.05),
+    (10000, 0.02),
+]
+EARNED_INCOME_DEDUCTION_LIMIT = 2000
+
+PERSONAL_DEDUCTION = 150  # 기본공제 1인당
+LOCAL_TAX_RATE = 0.10  # 지방소득세 (소득세의 10%)
+
+
+# 구간 하한/기울기와 각 하한까지의 누적값을 미리 계산한 표
+def _piecewise_table(brackets):
+    lower = np.array([b[0] for b in brackets], dtype=float)
+    slope = np.array([b[1] for b in brackets], dtype=float)
+    base = np.concatenate([[0.0], np.cumsum(np.diff(lower) * slope[:-1])])
+    return lower, slope, base
+
+
+_TAX_TABLE = _piecewise_table(TAX_BRACKETS)
+_DEDUCTION_TABLE = _piecewise_table(EARNED_INCOME_DEDUCTION)
+
+
+# 구간표에서 searchsorted 로 구간을 찾아 누적값 + 기울기 × 초과분 계산
+def _evaluate(table, amount):
+    lower, slope, base = table
+    amount = np.maximum(np.asarray(amount, dtype=float), 0)
+    index = np.searchsorted(lower, amount, side="right") - 1
+    return base[index] + slope[index] * (amount - lower[index])
+
+
+def earned_income_deduction(income):
+    return np.minimum(_evaluate(_DEDUCTION_TABLE, income), EARNED_INCOME_DEDUCTION_LIMIT)
+
+
+def taxable_income(income, dependents=0):
+    personal = PERSONAL_DEDUCTION * (1 + np.asarray(dependents, dtype=float))
+    return np.maximum(np.asarray(income, dtype=float) - earned_income_deduction(income) - personal, 0)
+
+
+# 연소득 (배열 가능) 에 대한 소득세, 지방소득세, 총 세액을 한 번에 계산
+def income_tax(income, dependents=0):
+    base = taxable_income(income, dependents)
+    national = _evaluate(_TAX_TABLE, base)
+    local = national * LOCAL_TAX_RATE
+    return {
+        "과세표준": base,
+        "소득세": national,
+        "지방소득세": local,
+        "총 세액": national + local,
+    }
+
+
+# 과세표준이 속한 구간의 한계세율 (%)
+def marginal_rate(income, dependents=0):
+    lower, slope, _ = _TAX_TABLE
+    index = np.searchsorted(lower, taxable_income(income, dependents), side="right") - 1
+    return slope[index] * 100
+
+
+# 보고서/PDF 에 쓰는 세금 관리 항목 요약 (단위: 만원)
+def tax_summary(data):
+    income = data["연소득"]
+    dependents = data.get("부양가족 수", 0)
+    result = income_tax(income, dependents)
+    total = float(result["총 세액"])
+    return {
+        "과세표준": round(float(result["과세표준"])),
+        "소득세": round(float(result["소득세"])),
+        "지방소득세": round(float(result["지방소득세"])),
+        "총 세액": round(total),
+        "실효세율": f"{total / income * 100:.1f}%" if income else "0.0%",
+        "한계세율": f"{float(marginal_rate(income, dependents)):.0f}%",
+    }